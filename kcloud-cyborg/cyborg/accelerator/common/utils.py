@@ -13,6 +13,7 @@
 # under the License.
 
 import collections
+import functools
 import os
 import re
 
@@ -27,18 +28,26 @@ _PCI_ADDRESS_PATTERN = ("^(hex{4}):(hex{2}):(hex{2}).(oct{1})$".
 _PCI_ADDRESS_REGEX = re.compile(_PCI_ADDRESS_PATTERN)
 
 
-def pci_str_to_json(pci_address, physnet=None):
+@functools.lru_cache(maxsize=4096)
+def pci_str_to_dict(pci_address, physnet=None):
+    """Parse a PCI address like "0000:0b:00.0" into its BDF fields.
+
+    The result is cached per address and shared between callers, so it
+    must not be modified.
+    """
     dbs, func = pci_address.split('.')
     domain, bus, slot = dbs.split(':')
-    keys = ["domain", "bus", "device", "function"]
-    values = [domain, bus, slot, func]
+    bdf_dict = {"domain": domain, "bus": bus, "device": slot,
+                "function": func}
     if physnet:
-        keys.append("physical_network")
-        values.append(physnet)
-    bdf_dict = dict(zip(keys, values))
-    ordered_dict = collections.OrderedDict(sorted(bdf_dict.items()))
-    bdf_json = jsonutils.dumps(ordered_dict)
-    return bdf_json
+        bdf_dict["physical_network"] = physnet
+    return bdf_dict
+
+
+@functools.lru_cache(maxsize=4096)
+def pci_str_to_json(pci_address, physnet=None):
+    return jsonutils.dumps(pci_str_to_dict(pci_address, physnet),
+                           sort_keys=True)
 
 
 def _get_sysfs_netdev_path(pci_addr, vf_interface=False):
@@ -26,10 +26,14 @@ Cyborg AICHIP driver implementation.
 from oslo_log import log as logging
 
 from cyborg.accelerator.drivers.aichip import utils
+from cyborg.common import utils as common_utils
 
 
 LOG = logging.getLogger(__name__)
 
+# Upper bound of threads used to probe AICHIP vendors in parallel.
+MAX_DISCOVER_WORKERS = 8
+
 
 class AICHIPDriver(object):
     """Base class for AICHIP drivers.
@@ -38,13 +42,33 @@ class AICHIPDriver(object):
     Vendor should implement their specific drivers.
     """
 
+    # Maps VENDOR name to driver subclass, built lazily on first create().
+    _vendor_index = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # NOTE: a newly loaded vendor driver must show up in create(), so
+        # drop the cached index of every direct parent.
+        for base in cls.__bases__:
+            if issubclass(base, AICHIPDriver):
+                base._invalidate_vendor_index()
+
+    @classmethod
+    def _invalidate_vendor_index(cls):
+        cls._vendor_index = None
+
     @classmethod
     def create(cls, vendor, *args, **kwargs):
-        for sclass in cls.__subclasses__():
-            vendor_name = utils.VENDOR_MAPS.get(vendor, vendor)
-            if vendor_name == sclass.VENDOR:
-                return sclass(*args, **kwargs)
-        raise LookupError("Not find the AICHIP driver for vendor %s" % vendor)
+        if cls._vendor_index is None:
+            cls._vendor_index = {
+                sclass.VENDOR: sclass for sclass in cls.__subclasses__()
+            }
+        vendor_name = utils.VENDOR_MAPS.get(vendor, vendor)
+        sclass = cls._vendor_index.get(vendor_name)
+        if sclass is None:
+            raise LookupError(
+                "Not find the AICHIP driver for vendor %s" % vendor)
+        return sclass(*args, **kwargs)
 
     def discover(self):
         """Discover AICHIP information of current vendor(Identified by class).
@@ -60,3 +84,32 @@ class AICHIPDriver(object):
         :return: AICHIP vendor ID list.
         """
         return utils.discover_vendors()
+
+
+def discover_drivers(drivers):
+    """Run discover() of several AICHIP drivers concurrently.
+
+    Each vendor discovery blocks on an "lspci" subprocess, so probing them
+    in parallel bounds the wall time by the slowest vendor.
+
+    :param drivers: AICHIP driver instances.
+    :return: List of driver devices of all the drivers, in drivers order.
+    """
+    drivers = list(drivers)
+    if not drivers:
+        return []
+    if len(drivers) == 1:
+        return list(drivers[0].discover())
+    workers = min(len(drivers), MAX_DISCOVER_WORKERS)
+    with common_utils.ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda d: d.discover(), drivers)
+        return [dev for devs in results for dev in devs]
+
+
+def discover_all(vendors):
+    """Discover AICHIPs of several vendors concurrently.
+
+    :param vendors: AICHIP vendor names or IDs, eg. ["1ed2", "rebellions"].
+    :return: List of driver devices of all the vendors.
+    """
+    return discover_drivers(AICHIPDriver.create(v) for v in vendors)
@@ -25,8 +25,12 @@
 Cyborg Furiosa AICHIP driver implementation.
 """
 
+import hashlib
+import json
+import threading
+import time
+
 from oslo_log import log as logging
-from oslo_serialization import jsonutils
 
 
 from cyborg.accelerator.common import utils
@@ -41,6 +45,18 @@ from cyborg.objects.driver_objects import driver_device
 
 LOG = logging.getLogger(__name__)
 
+# PCI topology rarely changes, so discovery results are reused for a short
+# while instead of running "lspci" on every agent poll.
+_DISCOVER_TTL = 5.0
+_DISCOVER_CACHE = {}
+_DISCOVER_LOCK = threading.Lock()
+# vendor_id -> (fingerprint of the raw "lspci" lines, driver devices), used
+# to skip rebuilding the devices when the PCI listing did not change.
+_LAST_DISCOVERY = {}
+
+_OWNER_TRAIT = "OWNER_CYBORG"
+_AICHIP_RC = constants.RESOURCES["AICHIP"]
+
 
 def _get_traits(vendor_id, product_id):
     """Generate traits for AICHIPs.
@@ -49,45 +65,33 @@ def _get_traits(vendor_id, product_id):
     Example AICHIP traits:
     {traits:["OWNER_CYBORG", "CUSTOM_FURIOSA_0000"]}
     """
-    traits = ["OWNER_CYBORG"]
+    vendor_upper = aichip_utils.VENDOR_MAPS_UPPER.get(vendor_id, "")
     # AICHIP trait
-    aichip_trait = "_".join(
-        (
-            "CUSTOM",
-            aichip_utils.VENDOR_MAPS.get(vendor_id, "").upper(),
-            product_id.upper(),
-        )
-    )
-    traits.append(aichip_trait)
-    return {"traits": traits}
+    aichip_trait = f"CUSTOM_{vendor_upper}_{product_id.upper()}"
+    return {"traits": [_OWNER_TRAIT, aichip_trait]}
 
 
 def _generate_attribute_list(aichip):
     attr_list = []
-    index = 0
-    for k, v in aichip.items():
-        if k == "rc":
-            driver_attr = driver_attribute.DriverAttribute()
-            driver_attr.key, driver_attr.value = k, v
-            attr_list.append(driver_attr)
-        if k == "traits":
-            values = aichip.get(k, [])
-            for val in values:
-                driver_attr = driver_attribute.DriverAttribute(
-                    key="trait" + str(index), value=val
-                )
-                index = index + 1
-                attr_list.append(driver_attr)
+    if "rc" in aichip:
+        attr_list.append(
+            driver_attribute.DriverAttribute(key="rc", value=aichip["rc"])
+        )
+    for index, val in enumerate(aichip.get("traits", ())):
+        attr_list.append(
+            driver_attribute.DriverAttribute(key=f"trait{index}", value=val)
+        )
     return attr_list
 
 
 def _generate_attach_handle(aichip, num=None):
-    driver_ah = driver_attach_handle.DriverAttachHandle()
-    driver_ah.in_use = False
-    if aichip["rc"] == "CUSTOM_AICHIP":
-        driver_ah.attach_type = constants.AH_TYPE_PCI
-        driver_ah.attach_info = utils.pci_str_to_json(aichip["devices"])
-    return driver_ah
+    if aichip["rc"] == _AICHIP_RC:
+        return driver_attach_handle.DriverAttachHandle(
+            in_use=False,
+            attach_type=constants.AH_TYPE_PCI,
+            attach_info=aichip["_pci_json"],
+        )
+    return driver_attach_handle.DriverAttachHandle(in_use=False)
 
 
 def _generate_dep_list(aichip):
@@ -100,36 +104,36 @@ def _generate_dep_list(aichip):
     # NOTE(yumeng) Since Wallaby release, the deplpyable_name is named as
     # <Compute_hostname>_<Device_address>
     driver_dep.name = aichip.get("hostname", "") + "_" + aichip["devices"]
-    driver_dep.driver_name = aichip_utils.VENDOR_MAPS.get(
+    driver_dep.driver_name = aichip_utils.VENDOR_MAPS_UPPER.get(
         aichip["vendor_id"], ""
-    ).upper()
+    )
     # if it is AICHIP, num_accelerators = 1
-    if aichip["rc"] == constants.RESOURCES["AICHIP"]:
+    if aichip["rc"] == _AICHIP_RC:
         driver_dep.num_accelerators = 1
         driver_dep.attach_handle_list = [_generate_attach_handle(aichip)]
     return [driver_dep]
 
 
 def _generate_controlpath_id(aichip):
-    driver_cpid = driver_controlpath_id.DriverControlPathID()
-    driver_cpid.cpid_type = "PCI"
-    driver_cpid.cpid_info = utils.pci_str_to_json(aichip["devices"])
-    return driver_cpid
+    return driver_controlpath_id.DriverControlPathID(
+        cpid_type="PCI", cpid_info=aichip["_pci_json"]
+    )
 
 
 def _generate_driver_device(aichip):
     driver_device_obj = driver_device.DriverDevice()
     driver_device_obj.vendor = aichip["vendor_id"]
     driver_device_obj.model = aichip.get("model", "miss model info")
-    std_board_info = {
-        "product_id": aichip.get("product_id"),
-        "controller": aichip.get("controller"),
-    }
-    vendor_board_info = {
-        "vendor_info": aichip.get("vendor_info", "aichip_vb_info")
-    }
-    driver_device_obj.std_board_info = jsonutils.dumps(std_board_info)
-    driver_device_obj.vendor_board_info = jsonutils.dumps(vendor_board_info)
+    # NOTE: the board info schema is fixed, so format the JSON directly
+    # instead of going through the generic encoder for the whole dict.
+    driver_device_obj.std_board_info = (
+        f'{{"product_id": {json.dumps(aichip.get("product_id"))}, '
+        f'"controller": {json.dumps(aichip.get("controller"))}}}'
+    )
+    driver_device_obj.vendor_board_info = (
+        f'{{"vendor_info": '
+        f'{json.dumps(aichip.get("vendor_info", "aichip_vb_info"))}}}'
+    )
     driver_device_obj.type = constants.DEVICE_AICHIP
     driver_device_obj.stub = aichip.get("stub", False)
     driver_device_obj.controlpath_id = _generate_controlpath_id(aichip)
@@ -141,27 +145,49 @@ def _discover_aichips(vendor_id):
     """param: vendor_id=VENDOR_ID means only discover Furiosa AICHIP
        on the host
     """
-    # discover aichip devices by "lspci"
+    # discover aichip devices by sysfs, or "lspci" if sysfs is unavailable
     aichip_list = []
-    aichips = aichip_utils.get_pci_devices(
-        aichip_utils.AICHIP_FLAGS, vendor_id
-    )
+    aichips = aichip_utils.get_aichips(vendor_id)
+    # NOTE: the hostname is part of the deployable names, so it belongs to
+    # the fingerprint as well.
+    fingerprint = hashlib.blake2b(
+        repr((CONF.host, aichips)).encode("utf-8")
+    ).digest()
+    last = _LAST_DISCOVERY.get(vendor_id)
+    if last is not None and last[0] == fingerprint:
+        return last[1]
     # report trait,rc and generate driver object
-    for aichip in aichips:
-        m = aichip_utils.AICHIP_INFO_PATTERN.match(aichip)
-        if m:
-            aichip_dict = m.groupdict()
-            # get hostname for deployable_name usage
-            aichip_dict["hostname"] = CONF.host
-            aichip_dict["rc"] = constants.RESOURCES["AICHIP"]
-            traits = _get_traits(
-                aichip_dict["vendor_id"], aichip_dict["product_id"]
-            )
-            aichip_dict.update(traits)
-            aichip_list.append(_generate_driver_device(aichip_dict))
+    for aichip_dict in aichips:
+        # get hostname for deployable_name usage
+        aichip_dict["hostname"] = CONF.host
+        aichip_dict["rc"] = _AICHIP_RC
+        # shared by the attach handle and the controlpath id
+        aichip_dict["_pci_json"] = utils.pci_str_to_json(
+            aichip_dict["devices"])
+        traits = _get_traits(
+            aichip_dict["vendor_id"], aichip_dict["product_id"]
+        )
+        aichip_dict.update(traits)
+        aichip_list.append(_generate_driver_device(aichip_dict))
+    _LAST_DISCOVERY[vendor_id] = (fingerprint, aichip_list)
     return aichip_list
 
 
 def discover(vendor_id):
-    devs = _discover_aichips(vendor_id)
-    return devs
+    with _DISCOVER_LOCK:
+        cached = _DISCOVER_CACHE.get(vendor_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _DISCOVER_TTL:
+            return list(cached[1])
+        devs = _discover_aichips(vendor_id)
+        _DISCOVER_CACHE[vendor_id] = (now, devs)
+        return list(devs)
+
+
+def _discover_cache_clear():
+    with _DISCOVER_LOCK:
+        _DISCOVER_CACHE.clear()
+        _LAST_DISCOVERY.clear()
+
+
+discover.cache_clear = _discover_cache_clear
@@ -24,6 +24,9 @@ Utils for AICHIP driver.
 from oslo_concurrency import processutils
 from oslo_log import log as logging
 
+import functools
+import io
+import os
 import re
 
 import cyborg.conf
@@ -31,42 +34,142 @@ import cyborg.privsep
 
 LOG = logging.getLogger(__name__)
 
-AICHIP_FLAGS = ["Processing accelerators"]
+# NOTE: "lspci" output is matched as raw bytes so that lines which are not
+# AICHIPs are never decoded; only the captured fields are decoded.
+AICHIP_FLAGS = [b"Processing accelerators"]
 AICHIP_INFO_PATTERN = re.compile(
-    r"(?P<devices>[0-9a-fA-F]{4}:[0-9a-fA-F]{2}:"
-    r"[0-9a-fA-F]{2}\.[0-9a-fA-F]) "
-    r"(?P<controller>.*) [\[].*]: (?P<model>.*) .*"
-    r"[\[](?P<vendor_id>[0-9a-fA-F]"
-    r"{4}):(?P<product_id>[0-9a-fA-F]{4})].*"
+    rb"(?P<devices>[0-9a-fA-F]{4}:[0-9a-fA-F]{2}:"
+    rb"[0-9a-fA-F]{2}\.[0-9a-fA-F]) "
+    rb"(?P<controller>.*) [\[].*]: (?P<model>.*) .*"
+    rb"[\[](?P<vendor_id>[0-9a-fA-F]"
+    rb"{4}):(?P<product_id>[0-9a-fA-F]{4})].*"
 )
 
 VENDOR_MAPS = {"1ed2": "furiosa", "1eff": "rebellions"}
+VENDOR_MAPS_UPPER = {k: v.upper() for k, v in VENDOR_MAPS.items()}
+
+PCI_DEVICES_PATH = "/sys/bus/pci/devices"
+PCI_IDS_PATHS = ("/usr/share/misc/pci.ids", "/usr/share/hwdata/pci.ids")
+# PCI base class 0x12 is what "lspci" prints as "Processing accelerators".
+AICHIP_PCI_CLASS = 0x12
+AICHIP_CONTROLLER = "Processing accelerators"
 
 
 @cyborg.privsep.sys_admin_pctxt.entrypoint
 def lspci_privileged():
     cmd = ["lspci", "-nn", "-D"]
-    return processutils.execute(*cmd)
+    return processutils.execute(*cmd, binary=True)
+
+
+def decode_match(match):
+    """Decode the captured fields of an AICHIP_INFO_PATTERN match."""
+    return {k: v.decode("utf-8", "replace")
+            for k, v in match.groupdict().items()}
 
 
 def get_pci_devices(pci_flags, vendor_id=None):
-    device_for_vendor_out = []
-    all_device_out = []
-    lspci_out = lspci_privileged()[0].split("\n")
-    for pci in lspci_out:
+    """Yield the raw "lspci" lines (bytes) of devices matching pci_flags.
+
+    NOTE: "lspci" runs in the privsep daemon, which hands back its whole
+    output at once; the lines are still walked lazily rather than split
+    into a list, and only the matching ones are yielded.
+    """
+    if vendor_id:
+        vendor_id = vendor_id.encode("ascii")
+    for pci in io.BytesIO(lspci_privileged()[0]):
         if any(x in pci for x in pci_flags):
-            all_device_out.append(pci)
-            if vendor_id and vendor_id in pci:
-                device_for_vendor_out.append(pci)
-    return device_for_vendor_out if vendor_id else all_device_out
+            if not vendor_id or vendor_id in pci:
+                yield pci
 
 
-def discover_vendors():
-    vendors = set()
-    aichips = get_pci_devices(AICHIP_FLAGS)
-    for aichip in aichips:
-        m = AICHIP_INFO_PATTERN.match(aichip)
+def read_line(filename):
+    with open(filename) as f:
+        return f.readline().strip()
+
+
+@functools.lru_cache(maxsize=None)
+def get_pci_ids_names(vendor_id):
+    """Look up the vendor and device names of vendor_id in pci.ids.
+
+    :return: (vendor name, {product_id: device name}), vendor name is None
+             when pci.ids is not available or does not know the vendor.
+    """
+    for path in PCI_IDS_PATHS:
+        try:
+            f = open(path, encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        with f:
+            vendor_name = None
+            devices = {}
+            for line in f:
+                if vendor_name is None:
+                    if line.startswith(vendor_id + "  "):
+                        vendor_name = line[6:].strip()
+                elif line.startswith("\t\t") or line.startswith("#"):
+                    continue
+                elif line.startswith("\t"):
+                    devices[line[1:5]] = line[7:].strip()
+                else:
+                    break
+            return vendor_name, devices
+    return None, {}
+
+
+def scan_sysfs_pci(vendor_id=None):
+    """Discover AICHIPs by reading sysfs instead of parsing "lspci".
+
+    :param vendor_id: only report AICHIPs of this vendor, eg. "1ed2".
+    :return: list of dicts with the same keys as AICHIP_INFO_PATTERN
+             groups, or None if sysfs PCI devices are not available.
+    """
+    try:
+        entries = os.scandir(PCI_DEVICES_PATH)
+    except OSError:
+        return None
+    aichips = []
+    with entries:
+        for entry in entries:
+            path = entry.path
+            try:
+                pci_class = int(read_line(os.path.join(path, "class")), 16)
+                if pci_class >> 16 != AICHIP_PCI_CLASS:
+                    continue
+                vendor = read_line(os.path.join(path, "vendor"))[2:]
+                if vendor_id and vendor != vendor_id:
+                    continue
+                product = read_line(os.path.join(path, "device"))[2:]
+            except (OSError, ValueError):
+                LOG.debug("Failed to read PCI device %s from sysfs", path)
+                continue
+            aichip = {
+                "devices": entry.name,
+                "controller": AICHIP_CONTROLLER,
+                "vendor_id": vendor,
+                "product_id": product,
+            }
+            vendor_name, device_names = get_pci_ids_names(vendor)
+            if vendor_name:
+                aichip["model"] = " ".join(
+                    filter(None, (vendor_name, device_names.get(product))))
+            aichips.append(aichip)
+    aichips.sort(key=lambda aichip: aichip["devices"])
+    return aichips
+
+
+def get_aichips(vendor_id=None):
+    """Get AICHIP info dicts, from sysfs or from "lspci" as a fallback."""
+    aichips = scan_sysfs_pci(vendor_id)
+    if aichips is not None:
+        return aichips
+    # NOTE: no sysfs (e.g. non-Linux hosts), parse "lspci" output instead.
+    aichips = []
+    for pci in get_pci_devices(AICHIP_FLAGS, vendor_id):
+        m = AICHIP_INFO_PATTERN.match(pci)
         if m:
-            vendor_id = m.groupdict().get("vendor_id")
-            vendors.add(vendor_id)
-    return vendors
+            aichips.append(decode_match(m))
+    return aichips
+
+
+def discover_vendors():
+    return {aichip["vendor_id"] for aichip in get_aichips()}
@@ -23,6 +23,7 @@ from oslo_log import log as logging
 from stevedore import driver
 from stevedore.extension import ExtensionManager
 
+from cyborg.accelerator.drivers.aichip import base as aichip_base
 from cyborg.common import exception
 from cyborg.common import utils
 from cyborg.conf import CONF
@@ -68,8 +69,15 @@ class ResourceTracker(object):
         """Update the resource usage periodically.
         """
         acc_list = []
+        aichip_drivers = []
         for acc_driver in self.acc_drivers:
+            if isinstance(acc_driver, aichip_base.AICHIPDriver):
+                aichip_drivers.append(acc_driver)
+                continue
             acc_list.extend(acc_driver.discover())
+        # NOTE: every AICHIP vendor runs its own "lspci", probe them in
+        # parallel instead of one after another.
+        acc_list.extend(aichip_base.discover_drivers(aichip_drivers))
         # Call conductor_api here to diff and report acc data. Now, we actually
         # do not have the method report_data.
         try:
@@ -36,6 +36,17 @@ class TestUtils(unittest.TestCase):
         result = self.utils.pci_str_to_json(pci_address, 'physnet')
         self.assertEqual(result, json_str)
 
+    def test_pci_str_to_dict(self):
+        expected = {"bus": "0b", "device": "00", "domain": "0000",
+                    "function": "1"}
+        result = self.utils.pci_str_to_dict('0000:0b:00.1')
+        self.assertEqual(expected, result)
+        self.assertIs(result, self.utils.pci_str_to_dict('0000:0b:00.1'))
+
+        expected["physical_network"] = "physnet"
+        self.assertEqual(
+            expected, self.utils.pci_str_to_dict('0000:0b:00.1', 'physnet'))
+
     def test_mdev_str_to_json(self):
         json_str = '{"asked_type": "type", "bus": "0b", "device": "00", ' \
                    '"domain": "0000", "function": "1", "vgpu_mark": "mask"}'
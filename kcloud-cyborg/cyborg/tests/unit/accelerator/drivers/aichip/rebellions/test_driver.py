@@ -20,21 +20,32 @@
 import json
 from unittest import mock
 
+import fixtures
+
 from cyborg.accelerator.drivers.aichip.rebellions.driver import (
     RebellionsAICHIPDriver
 )
+from cyborg.accelerator.drivers.aichip.rebellions import sysinfo
+from cyborg.accelerator.drivers.aichip import utils
 from cyborg.tests import base
 
 rebellions_pci_res = (
-    '0000:00:0c.0 Processing accelerators [1200]: '
-    'Rebellions NPU [1eff:0000] (rev 01)\n'
-    '0000:00:0d.0 Processing accelerators [1200]: '
-    'Rebellions NPU [1eff:0000] (rev 01)\n',)
+    b'0000:00:0c.0 Processing accelerators [1200]: '
+    b'Rebellions NPU [1eff:0000] (rev 01)\n'
+    b'0000:00:0d.0 Processing accelerators [1200]: '
+    b'Rebellions NPU [1eff:0000] (rev 01)\n',)
 
 
 class TestRebellionsAICHIPDriver(base.TestCase):
     """Test Rebellions AICHIP driver."""
 
+    def setUp(self):
+        super(TestRebellionsAICHIPDriver, self).setUp()
+        sysinfo.discover.cache_clear()
+        self.addCleanup(sysinfo.discover.cache_clear)
+        self.useFixture(fixtures.MockPatchObject(
+            utils, "PCI_DEVICES_PATH", "/nonexistent"))
+
     @mock.patch('cyborg.accelerator.drivers.aichip.utils.lspci_privileged',
                 return_value=rebellions_pci_res)
     def test_discover(self, mock_pci):
@@ -19,11 +19,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from unittest import mock
 
+from cyborg.accelerator.drivers.aichip import base as aichip_base
 from cyborg.accelerator.drivers.aichip.base import AICHIPDriver
 from cyborg.accelerator.drivers.aichip.furiosa.driver import (
     FuriosaAICHIPDriver
 )
+from cyborg.accelerator.drivers.aichip.rebellions.driver import (
+    RebellionsAICHIPDriver
+)
 from cyborg.tests import base
 
 
@@ -33,6 +38,35 @@ class TestAICHIPDriver(base.TestCase):
         AICHIPDriver.create(FuriosaAICHIPDriver.VENDOR)
         self.assertRaises(LookupError, AICHIPDriver.create, "unknown_vendor")
 
+    def test_create_by_vendor_id(self):
+        # utils.VENDOR_MAPS maps '1ed2' to 'furiosa'
+        driver = AICHIPDriver.create(FuriosaAICHIPDriver.VENDOR_ID)
+        self.assertIsInstance(driver, FuriosaAICHIPDriver)
+
+    def test_create_after_new_subclass(self):
+        self.addCleanup(AICHIPDriver._invalidate_vendor_index)
+        AICHIPDriver.create(FuriosaAICHIPDriver.VENDOR)
+        self.assertIsNotNone(AICHIPDriver._vendor_index)
+
+        class FakeAICHIPDriver(AICHIPDriver):
+            VENDOR = "fake_vendor"
+
+        self.assertIsNone(AICHIPDriver._vendor_index)
+        self.assertIsInstance(AICHIPDriver.create("fake_vendor"),
+                              FakeAICHIPDriver)
+
     def test_discover(self):
         d = AICHIPDriver()
         self.assertRaises(NotImplementedError, d.discover)
+
+    @mock.patch.object(RebellionsAICHIPDriver, 'discover',
+                       return_value=['npu0', 'npu1'])
+    @mock.patch.object(FuriosaAICHIPDriver, 'discover',
+                       return_value=['warboy0'])
+    def test_discover_all(self, mock_furiosa, mock_rebellions):
+        devs = aichip_base.discover_all(
+            [FuriosaAICHIPDriver.VENDOR_ID, RebellionsAICHIPDriver.VENDOR])
+        self.assertEqual(['warboy0', 'npu0', 'npu1'], devs)
+        mock_furiosa.assert_called_once_with()
+        mock_rebellions.assert_called_once_with()
+        self.assertEqual([], aichip_base.discover_all([]))
@@ -19,15 +19,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
 import sys
 from unittest import mock
 
+import fixtures
 from oslo_serialization import jsonutils
 
 import cyborg
 from cyborg.accelerator.drivers.aichip.furiosa.driver import (
     FuriosaAICHIPDriver
 )
+from cyborg.accelerator.drivers.aichip.furiosa import sysinfo
 from cyborg.accelerator.drivers.aichip import utils
 from cyborg.tests import base
 
@@ -35,8 +38,8 @@ from cyborg.tests import base
 CONF = cyborg.conf.CONF
 
 FURIOSA_AICHIP_INFO = (
-    "0000:3b:00.0 Processing accelerators [1200]: "
-    "FuriosaAI, Inc. Warboy [1ed2:0000] (rev 01)"
+    b"0000:3b:00.0 Processing accelerators [1200]: "
+    b"FuriosaAI, Inc. Warboy [1ed2:0000] (rev 01)"
 )
 
 BUILTIN = "__builtin__" if (sys.version_info[0] < 3) else "__builtins__"
@@ -60,6 +63,51 @@ class TestAICHIPDriverUtils(base.TestCase):
     def setUp(self):
         super(TestAICHIPDriverUtils, self).setUp()
         self.p = p()
+        sysinfo.discover.cache_clear()
+        self.addCleanup(sysinfo.discover.cache_clear)
+        # NOTE: force the "lspci" fallback unless a test fakes sysfs.
+        self.useFixture(fixtures.MockPatchObject(
+            utils, "PCI_DEVICES_PATH", "/nonexistent"))
+
+    def _create_fake_sysfs(self):
+        tmp_path = self.useFixture(fixtures.TempDir()).path
+        pci_path = os.path.join(tmp_path, "devices")
+        fake_devices = {
+            "0000:3b:00.0": ("0x1ed2", "0x0000", "0x120000"),
+            "0000:00:1f.2": ("0x8086", "0xa102", "0x010601"),
+        }
+        for bdf, infos in fake_devices.items():
+            dev_path = os.path.join(pci_path, bdf)
+            os.makedirs(dev_path)
+            for name, value in zip(("vendor", "device", "class"), infos):
+                with open(os.path.join(dev_path, name), "w") as f:
+                    f.write(value + "\n")
+        pci_ids = os.path.join(tmp_path, "pci.ids")
+        with open(pci_ids, "w") as f:
+            f.write("1ed2  FuriosaAI, Inc.\n"
+                    "\t0000  Warboy\n"
+                    "1eff  Rebellions Inc.\n")
+        self.useFixture(fixtures.MockPatchObject(
+            utils, "PCI_DEVICES_PATH", pci_path))
+        self.useFixture(fixtures.MockPatchObject(
+            utils, "PCI_IDS_PATHS", (pci_ids,)))
+        utils.get_pci_ids_names.cache_clear()
+        self.addCleanup(utils.get_pci_ids_names.cache_clear)
+
+    @mock.patch("cyborg.accelerator.drivers.aichip.utils.lspci_privileged")
+    def test_scan_sysfs_pci(self, mock_devices):
+        self._create_fake_sysfs()
+        expected = [{
+            "devices": "0000:3b:00.0",
+            "controller": "Processing accelerators",
+            "model": "FuriosaAI, Inc. Warboy",
+            "vendor_id": "1ed2",
+            "product_id": "0000",
+        }]
+        self.assertEqual(expected, utils.scan_sysfs_pci("1ed2"))
+        self.assertEqual([], utils.scan_sysfs_pci("1eff"))
+        self.assertEqual({"1ed2"}, utils.discover_vendors())
+        mock_devices.assert_not_called()
 
     @mock.patch("cyborg.accelerator.drivers.aichip.utils.lspci_privileged")
     def test_discover_vendors(self, mock_devices):
@@ -161,6 +209,34 @@ class TestAICHIPDriverUtils(base.TestCase):
         )
         self.assertEqual(attribute_list, attribute_actual_data)
 
+    @mock.patch("cyborg.accelerator.drivers.aichip.utils.lspci_privileged")
+    def test_discover_aichips_cached(self, mock_devices_for_vendor):
+        mock_devices_for_vendor.return_value = self.p.stdout.readlines()
+        furiosa = FuriosaAICHIPDriver()
+
+        first = furiosa.discover()
+        second = furiosa.discover()
+        self.assertEqual(1, mock_devices_for_vendor.call_count)
+        self.assertEqual(first, second)
+
+        sysinfo.discover.cache_clear()
+        furiosa.discover()
+        self.assertEqual(2, mock_devices_for_vendor.call_count)
+
+    @mock.patch("cyborg.accelerator.drivers.aichip.furiosa.sysinfo."
+                "_generate_driver_device")
+    @mock.patch("cyborg.accelerator.drivers.aichip.utils.lspci_privileged")
+    def test_discover_aichips_unchanged_listing(self, mock_devices_for_vendor,
+                                                mock_generate):
+        mock_devices_for_vendor.return_value = self.p.stdout.readlines()
+        vendor_id = FuriosaAICHIPDriver.VENDOR_ID
+
+        first = sysinfo._discover_aichips(vendor_id)
+        second = sysinfo._discover_aichips(vendor_id)
+        self.assertEqual(2, mock_devices_for_vendor.call_count)
+        self.assertEqual(1, mock_generate.call_count)
+        self.assertIs(first, second)
+
 
 def multi_mock_open(*file_contents):
     """Create a mock "open" that will mock open multiple files in sequence.
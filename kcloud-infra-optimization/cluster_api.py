@@ -3,13 +3,19 @@
 """
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 import uvicorn
 import asyncio
+import functools
 import json
+import os
+import time
 from openstack_cluster_crud import (
     OpenStackClusterCRUD,
     ClusterConfig,
@@ -17,29 +23,78 @@ from openstack_cluster_crud import (
     ClusterStatus
 )
 _crud_controller: Optional[OpenStackClusterCRUD] = None
+# Shared pool for the blocking OpenStack SDK calls, so they do not stall the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+EXECUTOR_MAX_WORKERS = 32
+# Cluster templates rarely change; /health and /api/v1/templates share this cache
+TEMPLATE_CACHE_TTL = 60.0
+_template_cache: Optional[tuple] = None
+_template_lock = asyncio.Lock()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
 """
-    """global _crud_controller
+    """global _crud_controller, _executor, _template_cache
 
     try:
-        _crud_controller = OpenStackClusterCRUD(cloud_name="openstack")
+        _crud_controller = OpenStackClusterCRUD(
+            cloud_name="openstack",
+            pool_maxsize=EXECUTOR_MAX_WORKERS
+        )
         print("Connected to OpenStack")
     except Exception as e:
         print(f"Failed to connect to OpenStack: {e}")
         raise
+    _executor = ThreadPoolExecutor(
+        max_workers=EXECUTOR_MAX_WORKERS,
+        thread_name_prefix="openstack-api"
+    )
     
     yield
     
 
+    _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _template_cache = None
+    _crud_controller.close()
     _crud_controller = None
     print("Shutting down API server")
 
 
+async def _run(fn, *args, **kwargs):
+    """Run a blocking OpenStack call in the shared executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+_timestamp_cache = (0, "")
+
+
+def _timestamp() -> str:
+    """Current time in ISO format (second resolution), formatted once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
+
+async def _get_templates(crud: OpenStackClusterCRUD) -> List[Dict]:
+    """Return cluster templates, refreshed at most every TEMPLATE_CACHE_TTL seconds"""
+    global _template_cache
+    async with _template_lock:
+        now = time.monotonic()
+        if _template_cache and now - _template_cache[0] < TEMPLATE_CACHE_TTL:
+            return _template_cache[1]
+        templates = await _run(crud.get_cluster_templates)
+        _template_cache = (now, templates)
+        return templates
+
+
 app = FastAPI(
     title="Virtual Cluster Management API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -72,6 +127,8 @@ class ClusterUpdateRequest(BaseModel):
 """
     """class ClusterResponse(BaseModel):
 """
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     name: str
     status: str
@@ -126,7 +183,7 @@ async def root():
     return StatusResponse(
         status="healthy",
         message="Virtual Cluster Management API is running",
-        timestamp=datetime.now().isoformat()
+        timestamp=_timestamp()
     )
 
 
@@ -135,11 +192,11 @@ async def health_check(crud: OpenStackClusterCRUD = Depends(get_crud_controller)
     """
     try:
 
-        templates = crud.get_cluster_templates()
+        templates = await _get_templates(crud)
         return StatusResponse(
             status="healthy",
             message=f"Connected to OpenStack, {len(templates)} templates available",
-            timestamp=datetime.now().isoformat()
+            timestamp=_timestamp()
         )
     except Exception as e:
         raise HTTPException(status_code=503, detail=str(e))
@@ -150,7 +207,7 @@ async def health_check(crud: OpenStackClusterCRUD = Depends(get_crud_controller)
 async def list_templates(crud: OpenStackClusterCRUD = Depends(get_crud_controller)):
     """
     try:
-        templates = crud.get_cluster_templates()
+        templates = await _get_templates(crud)
         return templates
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -180,9 +237,9 @@ async def create_cluster(
         )
         
 
-        cluster_info = crud.create_cluster(config)
+        cluster_info = await _run(crud.create_cluster, config)
         
-        return ClusterResponse(**cluster_info.__dict__)
+        return ClusterResponse.model_validate(cluster_info)
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -200,8 +257,9 @@ async def list_clusters(
         if name:
             filters["name"] = name
             
-        clusters = crud.list_clusters(filters=filters if filters else None)
-        return [ClusterResponse(**cluster.__dict__) for cluster in clusters]
+        clusters = await _run(crud.list_clusters, filters=filters if filters else None)
+        # ClusterInfo already carries the response schema, skip pydantic re-validation
+        return ORJSONResponse([asdict(cluster) for cluster in clusters])
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -214,8 +272,8 @@ async def get_cluster(
 ):
     """
     try:
-        cluster = crud.get_cluster(cluster_id=cluster_id)
-        return ClusterResponse(**cluster.__dict__)
+        cluster = await _run(crud.get_cluster, cluster_id=cluster_id)
+        return ClusterResponse.model_validate(cluster)
         
     except Exception as e:
         if "not found" in str(e).lower():
@@ -231,13 +289,14 @@ async def update_cluster(
 ):
     """
     try:
-        cluster = crud.update_cluster(
+        cluster = await _run(
+            crud.update_cluster,
             cluster_id=cluster_id,
             node_count=request.node_count,
             max_node_count=request.max_node_count,
             min_node_count=request.min_node_count
         )
-        return ClusterResponse(**cluster.__dict__)
+        return ClusterResponse.model_validate(cluster)
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(status_code=404, detail=f"Cluster not found: {cluster_id}")
@@ -249,13 +308,13 @@ async def delete_cluster(
 ):
 """
     """try:
-        success = crud.delete_cluster(cluster_id, force=force)
+        success = await _run(crud.delete_cluster, cluster_id, force=force)
         
         if success:
             return StatusResponse(
                 status="success",
                 message=f"Cluster {cluster_id} deleted successfully",
-                timestamp=datetime.now().isoformat()
+                timestamp=_timestamp()
             )
         else:
             raise HTTPException(status_code=400, detail="Failed to delete cluster")
@@ -274,8 +333,8 @@ async def resize_cluster(
 ):
 """
     try:
-        cluster = crud.resize_cluster(cluster_id, node_count)
-        return ClusterResponse(**cluster.__dict__)
+        cluster = await _run(crud.resize_cluster, cluster_id, node_count)
+        return ClusterResponse.model_validate(cluster)
         
     except Exception as e:
         if "not found" in str(e).lower():
@@ -289,7 +348,7 @@ async def get_cluster_kubeconfig(
     crud: OpenStackClusterCRUD = Depends(get_crud_controller)
 ):
     """try:
-        config = crud.get_cluster_credentials(cluster_id)
+        config = await _run(crud.get_cluster_credentials, cluster_id)
         return config
         
     except Exception as e:
@@ -305,12 +364,12 @@ async def cleanup_stuck_clusters(
 ):
 """
     try:
-        deleted = crud.cleanup_stuck_clusters(hours=hours)
+        deleted = await _run(crud.cleanup_stuck_clusters, hours=hours)
         
         return StatusResponse(
             status="success",
             message=f"Cleaned up {len(deleted)} stuck clusters",
-            timestamp=datetime.now().isoformat()
+            timestamp=_timestamp()
         )
         
     except Exception as e:
@@ -328,28 +387,35 @@ async def create_multiple_clusters(
     created_clusters = []
     errors = []
     
-    for req in requests:
-        try:
-            config = ClusterConfig(
-                name=req.name,
-                cluster_template_id=req.cluster_template_id,
-                keypair=req.keypair,
-                master_count=req.master_count,
-                node_count=req.node_count,
-                master_flavor=req.master_flavor,
-                flavor=req.flavor,
-                docker_volume_size=req.docker_volume_size,
-                labels=req.labels,
-                fixed_network=req.fixed_network,
-                fixed_subnet=req.fixed_subnet,
-                floating_ip_enabled=req.floating_ip_enabled
-            )
-            
-            cluster_info = crud.create_cluster(config)
-            created_clusters.append(ClusterResponse(**cluster_info.__dict__))
-            
-        except Exception as e:
-            errors.append({"cluster": req.name, "error": str(e)})
+    configs = [
+        ClusterConfig(
+            name=req.name,
+            cluster_template_id=req.cluster_template_id,
+            keypair=req.keypair,
+            master_count=req.master_count,
+            node_count=req.node_count,
+            master_flavor=req.master_flavor,
+            flavor=req.flavor,
+            docker_volume_size=req.docker_volume_size,
+            labels=req.labels,
+            fixed_network=req.fixed_network,
+            fixed_subnet=req.fixed_subnet,
+            floating_ip_enabled=req.floating_ip_enabled
+        )
+        for req in requests
+    ]
+    
+    # Create all clusters concurrently; batch time is bounded by the slowest create
+    results = await asyncio.gather(
+        *(_run(crud.create_cluster, config) for config in configs),
+        return_exceptions=True
+    )
+    
+    for req, result in zip(requests, results):
+        if isinstance(result, Exception):
+            errors.append({"cluster": req.name, "error": str(result)})
+        else:
+            created_clusters.append(ClusterResponse.model_validate(result))
     
     if errors:
         raise HTTPException(
@@ -366,6 +432,9 @@ if __name__ == "__main__":
         "cluster_api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("API_WORKERS", os.cpu_count() or 1)),
+        reload=False,
         log_level="info"
     )
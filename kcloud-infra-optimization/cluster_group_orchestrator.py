@@ -4,15 +4,32 @@
 import os
 import json
 import asyncio
+import itertools
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields
 from enum import Enum
+import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from openstack_cluster_crud import OpenStackClusterCRUD, ClusterConfig, ClusterInfo
+from database.redis_keys import RedisKeys
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-class GroupType(Enum):
+
+# Group snapshots are serialized with orjson when it is installed
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+class GroupType(str, Enum):
 """
     """
     GPU_INTENSIVE = "gpu_intensive"
@@ -22,6 +39,32 @@ class GroupType(Enum):
     PRODUCTION = "production"
 
 
+# Members of a str-valued Enum hash like their values, so the map can be looked up
+# with either a GroupType or the plain string stored on ClusterGroupInfo
+_TEMPLATE_MAP: Dict[GroupType, str] = {
+    GroupType.GPU_INTENSIVE: "ai-k8s-template",
+    GroupType.CPU_COMPUTE: "compute-k8s-template",
+    GroupType.MIXED_WORKLOAD: "dev-k8s-template",
+    GroupType.DEVELOPMENT: "dev-k8s-template",
+    GroupType.PRODUCTION: "prod-k8s-template"
+}
+_DEFAULT_TEMPLATE = "dev-k8s-template"
+
+_now_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current time in ISO format (second resolution), formatted once per second"""
+    global _now_iso_cache
+    now = int(time.time())
+    if now != _now_iso_cache[0]:
+        _now_iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _now_iso_cache[1]
+
+# How long list_groups() results are reused; every mutation clears the cache
+LIST_CACHE_TTL = 2.0
+
+
 class GroupStatus(Enum):
     """
     CREATING = "creating"
@@ -51,6 +94,82 @@ class ClusterGroupConfig:
             self.labels = {}
 
 
+class ClusterTable:
+    """Columnar (struct-of-arrays) copy of a group's cluster sizes and utilization
+
+    Kept next to ClusterGroupInfo.clusters so that aggregates such as total nodes
+    and average utilization are computed with NumPy instead of walking dicts.
+    Rows stay dense: removing a cluster moves the last row into its slot.
+    """
+    _INITIAL_CAPACITY = 8
+    _COLUMNS = ('node_counts', 'master_counts', 'utilizations')
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.node_counts = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self.master_counts = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self.utilizations = np.zeros(self._INITIAL_CAPACITY, dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def add(self, cluster_id: str, node_count: int, master_count: int, utilization: float = 0.0):
+        row = len(self.ids)
+        if row == len(self.node_counts):
+            self._grow()
+        self.ids.append(cluster_id)
+        self._rows[cluster_id] = row
+        self.node_counts[row] = node_count
+        self.master_counts[row] = master_count
+        self.utilizations[row] = utilization
+    
+    def remove(self, cluster_id: str) -> bool:
+        row = self._rows.pop(cluster_id, None)
+        if row is None:
+            return False
+        last = len(self.ids) - 1
+        last_id = self.ids.pop()
+        if row != last:
+            self.ids[row] = last_id
+            self._rows[last_id] = row
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+        return True
+    
+    def set_utilization(self, cluster_id: str, utilization: float) -> bool:
+        row = self._rows.get(cluster_id)
+        if row is None:
+            return False
+        self.utilizations[row] = utilization
+        return True
+    
+    def total_nodes(self) -> int:
+        n = len(self.ids)
+        return int(self.node_counts[:n].sum() + self.master_counts[:n].sum())
+    
+    def avg_utilization(self) -> float:
+        n = len(self.ids)
+        return float(self.utilizations[:n].mean()) if n else 0.0
+    
+    def _grow(self):
+        # Geometric growth keeps appends amortized O(1)
+        capacity = 2 * len(self.node_counts)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    @classmethod
+    def from_clusters(cls, clusters: List[Dict]) -> "ClusterTable":
+        table = cls()
+        for c in clusters:
+            table.add(c['id'], c.get('node_count', 0), c.get('master_count', 0), c.get('utilization', 0.0))
+        return table
+
+
 @dataclass
 class ClusterGroupInfo:
     """
@@ -65,19 +184,40 @@ class ClusterGroupInfo:
     updated_at: str
     config: Dict
     metrics: Dict
+    # Side index over clusters for O(1) lookup/removal by cluster id
+    clusters_by_id: Dict[str, Dict] = field(default_factory=dict)
+    # Columnar sizes/utilization of the same clusters, for aggregation
+    cluster_table: ClusterTable = field(default_factory=ClusterTable, repr=False)
+    # Group-level labels shared by every cluster, built on first cluster spawn
+    base_labels: Dict[str, str] = field(default_factory=dict, repr=False)
+
+
+# ClusterGroupInfo fields rebuilt from clusters rather than mirrored to Redis
+_DERIVED_GROUP_FIELDS = frozenset({'clusters_by_id', 'cluster_table'})
 
 
 class ClusterGroupOrchestrator:
     """
     
-    def __init__(self, cloud_name: str = "openstack"):
+    def __init__(self, cloud_name: str = "openstack", max_concurrent_operations: int = 8,
+                 db_manager=None):
         """
         Args:
 """
         """
         self.crud = OpenStackClusterCRUD(cloud_name)
         self.groups = {}
+        # group_type value -> {group_id: group}, kept in creation order
+        self._by_type: Dict[str, Dict[str, ClusterGroupInfo]] = {}
+        # Optional DatabaseManager used to share group state between workers via Redis
+        self.db_manager = db_manager
+        # group_type value (None for all groups) -> (monotonic timestamp, groups)
+        self._list_cache: Dict[Optional[str], Tuple[float, List[ClusterGroupInfo]]] = {}
         self.active_operations = {}
+        # Bounds concurrent cluster create/delete calls to stay within OpenStack rate limits
+        self._operation_semaphore = asyncio.Semaphore(max_concurrent_operations)
+        # Suffix keeping names of clusters spawned in the same second distinct
+        self._cluster_seq = itertools.count(1)
         
         logger.info("Cluster Group Orchestrator initialized")
     
@@ -91,7 +231,9 @@ class ClusterGroupOrchestrator:
         """
         logger.info(f"Creating cluster group: {config.name}")
         
-        group_id = f"group-{config.name}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        now_iso = _now_iso()
+        group_id = f"group-{config.name}-{now.strftime('%Y%m%d%H%M%S')}"
         
         try:
 
@@ -103,14 +245,16 @@ class ClusterGroupOrchestrator:
                 clusters=[],
                 total_nodes=0,
                 active_clusters=0,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat(),
+                created_at=now_iso,
+                updated_at=now_iso,
                 config=asdict(config),
                 metrics=self._initialize_metrics()
             )
             
 
             self.groups[group_id] = group_info
+            self._by_type.setdefault(group_info.group_type, {})[group_id] = group_info
+            self._list_cache.clear()
             
 
             if config.min_clusters > 0:
@@ -118,7 +262,8 @@ class ClusterGroupOrchestrator:
             
 
             group_info.status = GroupStatus.ACTIVE.value
-            group_info.updated_at = datetime.now().isoformat()
+            group_info.updated_at = _now_iso()
+            await self._mirror_group(group_info)
             
             logger.info(f"Group {config.name} created successfully: {group_id}")
             return group_info
@@ -133,14 +278,38 @@ class ClusterGroupOrchestrator:
         """
         return self.groups.get(group_id)
     
+    async def fetch_group(self, group_id: str) -> Optional[ClusterGroupInfo]:
+        """Like get_group, but on a miss adopts the Redis snapshot mirrored by another worker"""
+        group = self.groups.get(group_id)
+        if group is not None or not self._redis_available():
+            return group
+        
+        data = await self.db_manager.redis_get(RedisKeys.cluster_group(group_id))
+        if not data:
+            return None
+        group = ClusterGroupInfo(**_loads(data))
+        group.clusters_by_id = {c['id']: c for c in group.clusters}
+        group.cluster_table = ClusterTable.from_clusters(group.clusters)
+        self.groups[group_id] = group
+        self._by_type.setdefault(group.group_type, {})[group_id] = group
+        self._list_cache.clear()
+        return group
+    
     def list_groups(self, group_type: Optional[GroupType] = None) -> List[ClusterGroupInfo]:
         """
-        groups = list(self.groups.values())
+        key = group_type.value if group_type else None
+        cached = self._list_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < LIST_CACHE_TTL:
+            return list(cached[1])
         
         if group_type:
-            groups = [g for g in groups if g.group_type == group_type.value]
-            
-        return groups
+            groups = list(self._by_type.get(group_type.value, {}).values())
+        else:
+            groups = list(self.groups.values())
+        
+        self._list_cache[key] = (now, groups)
+        return list(groups)
     
     async def delete_group(self, group_id: str, force: bool = False) -> bool:
         """
@@ -161,19 +330,33 @@ class ClusterGroupOrchestrator:
             
 
             deleted_count = 0
-            for cluster_info in group.clusters.copy():
-                try:
-                    success = self.crud.delete_cluster(cluster_info['id'], force=force)
-                    if success:
-                        deleted_count += 1
-                        group.clusters.remove(cluster_info)
-                except Exception as e:
-                    logger.error(f"Failed to delete cluster {cluster_info['name']}: {e}")
-                    if not force:
-                        raise
+            results = await self._bulk_delete([c['id'] for c in group.clusters], force=force)
+            # Rebuild the list in one pass instead of list.remove() per deleted cluster
+            remaining = []
+            first_error = None
+            for cluster_info, result in zip(group.clusters, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to delete cluster {cluster_info['name']}: {result}")
+                    first_error = first_error or result
+                    remaining.append(cluster_info)
+                elif result:
+                    deleted_count += 1
+                    group.clusters_by_id.pop(cluster_info['id'], None)
+                    group.cluster_table.remove(cluster_info['id'])
+                else:
+                    remaining.append(cluster_info)
+            group.clusters = remaining
+            group.active_clusters = len(remaining)
+            group.total_nodes = group.cluster_table.total_nodes()
+            
+            if first_error is not None and not force:
+                raise first_error
             
 
             del self.groups[group_id]
+            self._by_type.get(group.group_type, {}).pop(group_id, None)
+            self._list_cache.clear()
+            await self._forget_group(group_id)
             
             logger.info(f"Group {group_id} deleted successfully ({deleted_count} clusters)")
             return True
@@ -202,7 +385,7 @@ class ClusterGroupOrchestrator:
         try:
 
             config = self._build_cluster_config(group, cluster_config)
-            cluster = self.crud.create_cluster(config)
+            cluster = await asyncio.to_thread(self.crud.create_cluster, config)
             
 
             cluster_info = {
@@ -218,9 +401,14 @@ class ClusterGroupOrchestrator:
             }
             
             group.clusters.append(cluster_info)
+            group.clusters_by_id[cluster.id] = cluster_info
+            group.cluster_table.add(cluster.id, cluster.node_count, cluster.master_count)
             group.active_clusters += 1
-            group.total_nodes += cluster.node_count + cluster.master_count
-            group.updated_at = datetime.now().isoformat()
+            group.total_nodes = group.cluster_table.total_nodes()
+            group.metrics['avg_utilization'] = group.cluster_table.avg_utilization()
+            group.updated_at = _now_iso()
+            self._list_cache.clear()
+            await self._mirror_group(group)
             
             logger.info(f"Cluster {cluster.name} added to group {group_id}")
             return True
@@ -244,11 +432,7 @@ class ClusterGroupOrchestrator:
             return False
         
 
-        cluster_info = None
-        for c in group.clusters:
-            if c['id'] == cluster_id:
-                cluster_info = c
-                break
+        cluster_info = group.clusters_by_id.get(cluster_id)
         
         if not cluster_info:
             logger.error(f"Cluster {cluster_id} not found in group {group_id}")
@@ -260,14 +444,19 @@ class ClusterGroupOrchestrator:
                 await self._migrate_workloads_from_cluster(group_id, cluster_id)
             
 
-            success = self.crud.delete_cluster(cluster_id)
+            success = await asyncio.to_thread(self.crud.delete_cluster, cluster_id)
             
             if success:
 
+                group.clusters_by_id.pop(cluster_id, None)
                 group.clusters.remove(cluster_info)
+                group.cluster_table.remove(cluster_id)
                 group.active_clusters -= 1
-                group.total_nodes -= cluster_info.get('node_count', 0) + cluster_info.get('master_count', 0)
-                group.updated_at = datetime.now().isoformat()
+                group.total_nodes = group.cluster_table.total_nodes()
+                group.metrics['avg_utilization'] = group.cluster_table.avg_utilization()
+                group.updated_at = _now_iso()
+                self._list_cache.clear()
+                await self._mirror_group(group)
                 
                 logger.info(f"Cluster {cluster_id} removed from group {group_id}")
                 return True
@@ -308,7 +497,7 @@ class ClusterGroupOrchestrator:
             return {
                 'success': False,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
     
 
@@ -316,30 +505,24 @@ class ClusterGroupOrchestrator:
     def _build_cluster_config(self, group: ClusterGroupInfo, cluster_spec: Dict) -> ClusterConfig:
         """
 
-        template_map = {
-            GroupType.GPU_INTENSIVE.value: "ai-k8s-template",
-            GroupType.CPU_COMPUTE.value: "compute-k8s-template",
-            GroupType.MIXED_WORKLOAD.value: "dev-k8s-template",
-            GroupType.DEVELOPMENT.value: "dev-k8s-template",
-            GroupType.PRODUCTION.value: "prod-k8s-template"
-        }
+        template_id = _TEMPLATE_MAP.get(group.group_type, _DEFAULT_TEMPLATE)
         
-        template_id = template_map.get(group.group_type, "dev-k8s-template")
+        if not group.base_labels:
+            group.base_labels = {
+                **group.config.get('labels', {}),
+                'group_id': group.id,
+                'group_type': group.group_type
+            }
         
         return ClusterConfig(
-            name=f"{group.name}-{cluster_spec.get('name', 'auto')}-{datetime.now().strftime('%H%M%S')}",
+            name=f"{group.name}-{cluster_spec.get('name', 'auto')}-{next(self._cluster_seq)}",
             cluster_template_id=template_id,
             keypair="kcloud-keypair",
             master_count=cluster_spec.get('master_count', 1),
             node_count=cluster_spec.get('node_count', 2),
             fixed_network="cloud-platform-selfservice",
             fixed_subnet="cloud-platform-selfservice-subnet",
-            labels={
-                **group.config.get('labels', {}),
-                'group_id': group.id,
-                'group_type': group.group_type,
-                **cluster_spec.get('labels', {})
-            }
+            labels=group.base_labels | cluster_spec.get('labels', {})
         )
     
     def _initialize_metrics(self) -> Dict:
@@ -364,13 +547,62 @@ class ClusterGroupOrchestrator:
         if needed > 0:
             logger.info(f"Creating {needed} clusters for group {group_id}")
             
-            for i in range(needed):
-                cluster_spec = {
-                    'name': f'auto-{i+1}',
-                    'node_count': 1,
-                    'master_count': 1
-                }
-                await self.add_cluster_to_group(group_id, cluster_spec)
+            await asyncio.gather(
+                *(
+                    self._limited(self.add_cluster_to_group(group_id, {
+                        'name': f'auto-{i+1}',
+                        'node_count': 1,
+                        'master_count': 1
+                    }))
+                    for i in range(needed)
+                ),
+                return_exceptions=True
+            )
+    
+    async def _bulk_delete(self, ids: List[str], force: bool = False) -> List[Any]:
+        """Delete clusters concurrently, bounded by the operation semaphore
+
+        Magnum has no bulk cluster delete endpoint, so the per-cluster deletes are
+        fanned out instead. Returns one result (or raised exception) per id.
+        """
+        return await asyncio.gather(
+            *(
+                self._limited(asyncio.to_thread(self.crud.delete_cluster, cluster_id, force=force))
+                for cluster_id in ids
+            ),
+            return_exceptions=True
+        )
+    
+    def _redis_available(self) -> bool:
+        return self.db_manager is not None and self.db_manager.is_connected
+    
+    async def _mirror_group(self, group: ClusterGroupInfo):
+        """Publish the group snapshot to Redis so other workers can read it"""
+        if not self._redis_available():
+            return
+        
+        # Only persisted fields; the cluster indexes are derived from clusters
+        data = {f.name: getattr(group, f.name) for f in fields(group)
+                if f.name not in _DERIVED_GROUP_FIELDS}
+        try:
+            await self.db_manager.redis_set(RedisKeys.cluster_group(group.id), _dumps(data))
+        except Exception as e:
+            logger.warning(f"Failed to mirror group {group.id} to Redis: {e}")
+    
+    async def _forget_group(self, group_id: str):
+        """Drop the Redis snapshot of a deleted group"""
+        if not self._redis_available():
+            return
+        
+        try:
+            await self.db_manager.redis_delete(RedisKeys.cluster_group(group_id))
+        except Exception as e:
+            logger.warning(f"Failed to remove group {group_id} from Redis: {e}")
+    
+    async def _limited(self, coro):
+        """Run coro while holding a slot of the operation semaphore"""
+        async with self._operation_semaphore:
+            return await coro
     
     async def _migrate_workloads_from_cluster(self, group_id: str, cluster_id: str):
         """
@@ -384,7 +616,8 @@ class ClusterGroupOrchestrator:
         group_id = command.get('group_id')
         target_clusters = command.get('target_clusters')
         
-        group = self.groups.get(group_id)
+        # Commands may reach a worker other than the one that created the group
+        group = await self.fetch_group(group_id)
         if not group:
             raise ValueError(f"Group not found: {group_id}")
         
@@ -392,19 +625,31 @@ class ClusterGroupOrchestrator:
         
         if target_clusters > current_clusters:
 
-            for _ in range(target_clusters - current_clusters):
-                await self.add_cluster_to_group(group_id, {'name': 'scale-out', 'node_count': 2})
+            await asyncio.gather(
+                *(
+                    self._limited(self.add_cluster_to_group(
+                        group_id, {'name': f'scale-out-{i+1}', 'node_count': 2}
+                    ))
+                    for i in range(target_clusters - current_clusters)
+                ),
+                return_exceptions=True
+            )
         elif target_clusters < current_clusters:
 
             clusters_to_remove = group.clusters[target_clusters:]
-            for cluster_info in clusters_to_remove:
-                await self.remove_cluster_from_group(group_id, cluster_info['id'])
+            await asyncio.gather(
+                *(
+                    self._limited(self.remove_cluster_from_group(group_id, cluster_info['id']))
+                    for cluster_info in clusters_to_remove
+                ),
+                return_exceptions=True
+            )
         
         return {
             'success': True,
             'group_id': group_id,
             'new_cluster_count': len(self.groups[group_id].clusters),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
     async def _handle_consolidate_command(self, command: Dict) -> Dict:
@@ -427,7 +672,14 @@ class ClusterGroupOrchestrator:
 if __name__ == "__main__":
     async def main():
 
-        orchestrator = ClusterGroupOrchestrator()
+        # Redis mirrors group state for other workers; run standalone without it
+        db_manager = None
+        try:
+            from database.connection import init_database
+            db_manager = await init_database()
+        except Exception as e:
+            logger.warning(f"Database unavailable, group state stays in-process: {e}")
+        orchestrator = ClusterGroupOrchestrator(db_manager=db_manager)
         
 
         config = ClusterGroupConfig(
@@ -455,6 +707,14 @@ if __name__ == "__main__":
         
         result = await orchestrator.execute_optimization_command(command)
         print(f"Optimization result: {result}")
+        
+        if db_manager is not None:
+            await db_manager.disconnect()
     
 
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
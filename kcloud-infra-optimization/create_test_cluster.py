@@ -3,20 +3,31 @@
 """
 import os
 import time
+import asyncio
+import functools
 import json
 from datetime import datetime
 os.environ['OS_CLIENT_CONFIG_FILE'] = '/root/kcloud_opt/clouds.yaml'
 from openstack_cluster_crud import OpenStackClusterCRUD, ClusterConfig
-def create_test_cluster():
+
+
+@functools.lru_cache(maxsize=1)
+def _get_crud() -> OpenStackClusterCRUD:
+    """Shared client, so every step reuses one authenticated session"""
+    return OpenStackClusterCRUD()
+
+
+def create_test_cluster(crud=None, templates=None):
 """
     """
     print("Creating test cluster...")
     
-    crud = OpenStackClusterCRUD()
+    crud = crud or _get_crud()
     
 
     print("\nAvailable templates:")
-    templates = crud.get_cluster_templates()
+    if templates is None:
+        templates = crud.get_cluster_templates()
     for i, tmpl in enumerate(templates):
         print(f"  {i+1}. {tmpl['name']} (ID: {tmpl['id']})")
     
@@ -76,18 +87,22 @@ def create_test_cluster():
         return None
 
 
-def monitor_cluster_creation(cluster_id):
+# Upper bound of the status polling interval, in seconds
+MAX_POLL_INTERVAL = 30
+
+
+async def monitor_cluster_creation(cluster_id):
     """
     print(f"\nMonitoring cluster creation: {cluster_id}")
     
-    crud = OpenStackClusterCRUD()
+    crud = _get_crud()
     
     start_time = time.time()
     check_count = 0
     
     while True:
         try:
-            cluster = crud.get_cluster(cluster_id)
+            cluster = await asyncio.to_thread(crud.get_cluster, cluster_id)
             elapsed = time.time() - start_time
             check_count += 1
             
@@ -109,22 +124,24 @@ def monitor_cluster_creation(cluster_id):
             if elapsed > 3600:
                 print(f"\nTimeout after 1 hour")
                 break
-                
-            time.sleep(30)
+            
+            # Poll quickly at first so early state changes show up, then back off
+            await asyncio.sleep(min(MAX_POLL_INTERVAL, 2 ** check_count))
             
         except Exception as e:
             print(f"  Error checking status: {e}")
-            time.sleep(30)
+            await asyncio.sleep(MAX_POLL_INTERVAL)
 
 
-def list_all_clusters():
+def list_all_clusters(crud=None, clusters=None):
     """
     print("\nCurrent clusters:")
     
-    crud = OpenStackClusterCRUD()
+    crud = crud or _get_crud()
     
     try:
-        clusters = crud.list_clusters()
+        if clusters is None:
+            clusters = crud.list_clusters()
         
         if not clusters:
             print("  No clusters found")
@@ -143,32 +160,53 @@ def list_all_clusters():
         print(f"  Error: {e}")
 
 
-if __name__ == "__main__":
-    import sys
-    
+async def main(argv):
+    """Command line entry point"""
     print("="*60)
     print(" OpenStack Cluster Creation Test")
     print("="*60)
     
-
-    list_all_clusters()
+    crud = _get_crud()
     
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--create":
+    if len(argv) > 1 and argv[1] == "--create":
 
-        cluster = create_test_cluster()
+        # The cluster and template listings are independent round-trips
+        clusters, templates = await asyncio.gather(
+            asyncio.to_thread(crud.list_clusters),
+            asyncio.to_thread(crud.get_cluster_templates),
+            return_exceptions=True
+        )
+        if isinstance(clusters, Exception):
+            # Same report list_all_clusters gives when its own listing fails
+            print("\nCurrent clusters:")
+            print(f"  Error: {clusters}")
+        else:
+            list_all_clusters(crud, clusters)
+        if isinstance(templates, Exception):
+            raise templates
+
+        cluster = await asyncio.to_thread(create_test_cluster, crud, templates)
         
         if cluster:
             print(f"\nTo monitor progress, run:")
             print(f"   python create_test_cluster.py --monitor {cluster.id}")
             
-    elif len(sys.argv) > 2 and sys.argv[1] == "--monitor":
+    elif len(argv) > 2 and argv[1] == "--monitor":
 
-        cluster_id = sys.argv[2]
-        monitor_cluster_creation(cluster_id)
+        list_all_clusters(crud)
+        cluster_id = argv[2]
+        await monitor_cluster_creation(cluster_id)
         
     else:
+        list_all_clusters(crud)
         print("\nUsage:")
         print("  python create_test_cluster.py                    # List clusters")
         print("  python create_test_cluster.py --create          # Create new cluster")
         print("  python create_test_cluster.py --monitor <ID>    # Monitor cluster")
+
+
+if __name__ == "__main__":
+    import sys
+    
+    asyncio.run(main(sys.argv))
@@ -4,62 +4,87 @@
 import os
 import sys
 import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional, AsyncGenerator
+import warnings
+from typing import Dict, Any, List, Optional, AsyncGenerator, Union
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 try:
     import asyncpg
     import redis.asyncio as aioredis
     from asyncpg import Pool
     from redis.asyncio import Redis
+    from redis.asyncio.client import Pipeline
 except ImportError:
     raise ImportError("Database libraries (asyncpg, redis) not found. Please install them or set PYTHONPATH")
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+def _env_int(name: str, default: int):
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+def _env_str(name: str, default: Optional[str], secret: bool = False):
+    return field(default_factory=lambda: os.getenv(name, default), repr=not secret)
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
-"""
+    """Database settings read from the environment
+
+    Use get_database_config() to share a single instance instead of
+    re-reading the environment for every manager.
     """
-    
-    def __init__(self):
 
-        self.postgres_host = os.getenv('POSTGRES_HOST', 'localhost')
-        self.postgres_port = int(os.getenv('POSTGRES_PORT', 5432))
-        self.postgres_db = os.getenv('POSTGRES_DB', 'kcloud_opt')
-        self.postgres_user = os.getenv('POSTGRES_USER', 'kcloud_user')
-        self.postgres_password = os.getenv('POSTGRES_PASSWORD', '')
-        
+    postgres_host: str = _env_str('POSTGRES_HOST', 'localhost')
+    postgres_port: int = _env_int('POSTGRES_PORT', 5432)
+    postgres_db: str = _env_str('POSTGRES_DB', 'kcloud_opt')
+    postgres_user: str = _env_str('POSTGRES_USER', 'kcloud_user')
+    postgres_password: str = _env_str('POSTGRES_PASSWORD', '', secret=True)
+    
 
-        self.redis_host = os.getenv('REDIS_HOST', 'localhost')
-        self.redis_port = int(os.getenv('REDIS_PORT', 6379))
-        self.redis_db = int(os.getenv('REDIS_DB', 0))
-        self.redis_password = os.getenv('REDIS_PASSWORD', None)
-        
+    redis_host: str = _env_str('REDIS_HOST', 'localhost')
+    redis_port: int = _env_int('REDIS_PORT', 6379)
+    redis_db: int = _env_int('REDIS_DB', 0)
+    redis_password: Optional[str] = _env_str('REDIS_PASSWORD', None, secret=True)
+    
 
-        self.postgres_min_connections = int(os.getenv('POSTGRES_MIN_CONN', 10))
-        self.postgres_max_connections = int(os.getenv('POSTGRES_MAX_CONN', 50))
-        
+    postgres_min_connections: int = _env_int('POSTGRES_MIN_CONN', 10)
+    postgres_max_connections: int = _env_int('POSTGRES_MAX_CONN', 50)
+    redis_max_connections: int = _env_int('REDIS_MAX_CONN', 32)
+    
 
-        self.connection_timeout = int(os.getenv('DB_CONNECTION_TIMEOUT', 30))
-        self.query_timeout = int(os.getenv('DB_QUERY_TIMEOUT', 60))
+    connection_timeout: int = _env_int('DB_CONNECTION_TIMEOUT', 30)
+    query_timeout: int = _env_int('DB_QUERY_TIMEOUT', 60)
     
-    @property
-    def postgres_dsn(self) -> str:
-        """
-        return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+    # Derived from the fields above in __post_init__
+    postgres_dsn: str = field(init=False, repr=False)
+    redis_url: str = field(init=False, repr=False)
     
-    @property
-    def redis_url(self) -> str:
-        """
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'postgres_dsn',
+            f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
         auth = f":{self.redis_password}@" if self.redis_password else ""
-        return f"redis://{auth}{self.redis_host}:{self.redis_port}/{self.redis_db}"
+        object.__setattr__(
+            self, 'redis_url',
+            f"redis://{auth}{self.redis_host}:{self.redis_port}/{self.redis_db}"
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_database_config() -> DatabaseConfig:
+    """Return the process-wide DatabaseConfig, read from the environment once"""
+    return DatabaseConfig()
 
 
 class DatabaseManager:
     """
     
     def __init__(self, config: DatabaseConfig = None):
-        self.config = config or DatabaseConfig()
+        self.config = config or get_database_config()
         self.postgres_pool: Optional[Pool] = None
         self.redis_client: Optional[Redis] = None
         self._connected = False
@@ -90,9 +115,15 @@ class DatabaseManager:
                 min_size=self.config.postgres_min_connections,
                 max_size=self.config.postgres_max_connections,
                 command_timeout=self.config.query_timeout,
+                # Recurring queries reuse their per-connection prepared statements
+                statement_cache_size=1024,
+                max_queries=50_000,
+                max_inactive_connection_lifetime=300,
                 server_settings={
                     'application_name': 'kcloud-opt',
                     'search_path': 'public',
+                    # JIT compilation costs more than it saves on small OLTP queries
+                    'jit': 'off',
                 }
             )
         except Exception as e:
@@ -103,6 +134,9 @@ class DatabaseManager:
             self.redis_client = aioredis.from_url(
                 self.config.redis_url,
                 decode_responses=True,
+                protocol=3,
+                # One bounded pool per manager, shared by every caller of redis_client
+                max_connections=self.config.redis_max_connections,
                 socket_timeout=self.config.connection_timeout,
                 socket_connect_timeout=self.config.connection_timeout,
                 retry_on_timeout=True,
@@ -158,15 +192,49 @@ class DatabaseManager:
     
     async def execute_query(self, query: str, *args, **kwargs) -> Any:
 """
+        warnings.warn(
+            "execute_query() is deprecated, use fetch_all/fetch_one/fetch_val/execute",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        fetch = kwargs.get('fetch')
+        if fetch == 'one':
+            return await self.fetch_one(query, *args)
+        elif fetch == 'val':
+            return await self.fetch_val(query, *args)
+        elif fetch == 'all':
+            return await self.fetch_all(query, *args)
+        return await self.execute(query, *args)
+    
+    async def fetch_all(self, query: str, *args) -> List[asyncpg.Record]:
+        """Run a query and return all rows"""
+        async with self.postgres_connection() as conn:
+            return await conn.fetch(query, *args)
+    
+    async def fetch_one(self, query: str, *args) -> Optional[asyncpg.Record]:
+        """Run a query and return the first row, or None"""
         async with self.postgres_connection() as conn:
-            if kwargs.get('fetch', 'all') == 'one':
-                return await conn.fetchrow(query, *args)
-            elif kwargs.get('fetch') == 'val':
-                return await conn.fetchval(query, *args)
-            elif kwargs.get('fetch') == 'all':
-                return await conn.fetch(query, *args)
-            else:
-                return await conn.execute(query, *args)
+            return await conn.fetchrow(query, *args)
+    
+    async def fetch_val(self, query: str, *args) -> Any:
+        """Run a query and return the first column of the first row"""
+        async with self.postgres_connection() as conn:
+            return await conn.fetchval(query, *args)
+    
+    async def execute(self, query: str, *args) -> str:
+        """Run a statement and return its status string"""
+        async with self.postgres_connection() as conn:
+            return await conn.execute(query, *args)
+    
+    async def copy_records(self, table: str, records: List[tuple], columns: List[str]) -> str:
+        """Bulk-load rows into table with a single binary COPY"""
+        async with self.postgres_connection() as conn:
+            return await conn.copy_records_to_table(table, records=records, columns=columns)
+    
+    async def execute_many(self, query: str, args: List[tuple]) -> None:
+        """Run one statement for every argument tuple on a single connection"""
+        async with self.postgres_connection() as conn:
+            await conn.executemany(query, args)
     
     async def redis_get(self, key: str, default=None) -> Any:
         """if not self._connected:
@@ -194,6 +262,49 @@ class DatabaseManager:
         except Exception as e:
             return 0
     
+    @asynccontextmanager
+    async def redis_pipeline(self, transaction: bool = False) -> AsyncGenerator[Pipeline, None]:
+        """Queue several Redis commands and send them in one round-trip
+
+        Callers queue commands on the yielded pipeline and `await pipe.execute()`.
+        Unlike the single-key helpers this raises RuntimeError when not connected,
+        so callers check is_connected first.
+        """
+        if not self._connected:
+            raise RuntimeError("Database is not connected")
+        async with self.redis_client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+    
+    async def redis_mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Fetch several keys in one round-trip (None for missing keys)"""
+        if not self._connected:
+            return [None] * len(keys)
+        if not keys:
+            return []
+        try:
+            return await self.redis_client.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis MGET failed: {e}")
+            return [None] * len(keys)
+    
+    async def redis_mset(self, mapping: Dict[str, Union[str, bytes]], expire: int = None) -> bool:
+        """Set several keys in one round-trip, each with the same optional TTL"""
+        if not self._connected:
+            return False
+        if not mapping:
+            return True
+        try:
+            if expire is None:
+                return bool(await self.redis_client.mset(mapping))
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, value, ex=expire)
+                results = await pipe.execute()
+            return all(results)
+        except Exception as e:
+            logger.error(f"Redis MSET failed: {e}")
+            return False
+    
     async def redis_publish(self, channel: str, message: str) -> int:
 """
         if not self._connected:
@@ -213,21 +324,21 @@ class DatabaseManager:
         if not self._connected:
             return status
         
-        try:
-
-            async with self.postgres_connection() as conn:
-                await conn.fetchval("SELECT 1")
-                status['postgres'] = True
-        except Exception as e:
-        
-        try:
-
-            await self.redis_client.ping()
-            status['redis'] = True
-        except Exception as e:
+        # Both pings are independent, so wait for the slower one only
+        pg_result, redis_result = await asyncio.gather(
+            self._pg_ping(),
+            self.redis_client.ping(),
+            return_exceptions=True
+        )
+        status['postgres'] = not isinstance(pg_result, BaseException)
+        status['redis'] = not isinstance(redis_result, BaseException)
         
         return status
     
+    async def _pg_ping(self):
+        async with self.postgres_connection() as conn:
+            await conn.fetchval("SELECT 1")
+    
     @property
     def is_connected(self) -> bool:
 """
@@ -244,7 +355,8 @@ def get_database_manager() -> DatabaseManager:
 async def init_database():
     """
     db_manager = get_database_manager()
-    await db_manager.connect()
+    if not db_manager.is_connected:
+        await db_manager.connect()
     return db_manager
 
 async def close_database():
@@ -257,13 +369,17 @@ async def close_database():
 @asynccontextmanager
 async def database_context():
 """
-    db_manager = None
+    # Reuse the shared pool when the application already connected it; only
+    # a context that opened the connections tears them down again.
+    db_manager = get_database_manager()
+    owns_connection = not db_manager.is_connected
+    if owns_connection:
+        await db_manager.connect()
     try:
-        db_manager = await init_database()
         yield db_manager
     finally:
-        if db_manager:
-            await db_manager.disconnect()
+        if owns_connection:
+            await close_database()
 
 
 if __name__ == "__main__":
@@ -279,7 +395,7 @@ if __name__ == "__main__":
 
 
             try:
-                tables = await db.execute_query(
+                tables = await db.fetch_all(
                     "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'"
                 )
                 print(f"테이블 수: {len(tables)}")
@@ -298,4 +414,9 @@ if __name__ == "__main__":
                 print(f"Redis 테스트 실패: {e}")
     
 
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(test_connection())
@@ -4,18 +4,53 @@
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+import functools
 import json
+import time
 import hashlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+KEY_NAMESPACE = "kcloud"
+KEY_SEPARATOR = ":"
+_KEY_PREFIX = KEY_NAMESPACE + KEY_SEPARATOR
+
+
+def _join_key(*parts: str) -> str:
+    return _KEY_PREFIX + KEY_SEPARATOR.join(parts)
+
+
+# Key names repeat for every metric push/read, so the joined strings are cached.
+# Keys embedding a fresh timestamp go through _join_key directly instead.
+_build_key = functools.lru_cache(maxsize=4096)(_join_key)
+
+
+# (epoch of the next local midnight, current local date as YYYYMMDD)
+_today_cache = (0.0, "")
+
+
+def _today() -> str:
+    """Current local date as YYYYMMDD, recomputed only when the day rolls over"""
+    global _today_cache
+    if time.time() >= _today_cache[0]:
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _today_cache = (next_midnight.timestamp(), now.strftime("%Y%m%d"))
+    return _today_cache[1]
+
 
 class RedisKeys:
     """
     
 
-    NAMESPACE = "kcloud"
-    SEPARATOR = ":"
+    NAMESPACE = KEY_NAMESPACE
+    SEPARATOR = KEY_SEPARATOR
     
 
     CLUSTER = "cluster"
+    GROUPS = "groups"
     METRICS = "metrics"
     ALERTS = "alerts"
     DASHBOARD = "dashboard"
@@ -25,10 +60,7 @@ class RedisKeys:
     STATS = "stats"
     LOCK = "lock"
     
-    @classmethod
-    def _build_key(cls, *parts: str) -> str:
-        """
-        return cls.SEPARATOR.join([cls.NAMESPACE] + list(parts))
+    _build_key = staticmethod(_build_key)
     
 
     @classmethod
@@ -51,6 +83,11 @@ class RedisKeys:
         """
         return cls._build_key(cls.CLUSTER, "active_list")
     
+    @classmethod
+    def cluster_group(cls, group_id: str) -> str:
+        """Shared snapshot of a cluster group, mirrored by the orchestrator"""
+        return cls._build_key(cls.GROUPS, group_id)
+    
 
     @classmethod
     def metrics_latest(cls, cluster_name: str) -> str:
@@ -78,6 +115,11 @@ class RedisKeys:
         """
         return cls._build_key(cls.ALERTS, "by_cluster", cluster_name)
     
+    @classmethod
+    def alerts_clusters(cls) -> str:
+        """Set of cluster names that have an alerts_by_cluster set"""
+        return cls._build_key(cls.ALERTS, "clusters")
+    
     @classmethod
     def alerts_by_severity(cls, severity: str) -> str:
         """
@@ -87,9 +129,14 @@ class RedisKeys:
     def alerts_history(cls, date: str = None) -> str:
         """
         if not date:
-            date = datetime.now().strftime("%Y%m%d")
+            date = _today()
         return cls._build_key(cls.ALERTS, "history", date)
     
+    @classmethod
+    def alert_detail(cls, alert_id: str) -> str:
+        """Per-alert payload; ids are unique, so the key is not memoized"""
+        return _join_key("alert", "detail", alert_id)
+    
     @classmethod
     def alert_cooldown(cls, rule_name: str, cluster_name: str) -> str:
         """
@@ -101,7 +148,7 @@ class RedisKeys:
         """
         if not timestamp:
             timestamp = int(datetime.now().timestamp())
-        return cls._build_key(cls.DASHBOARD, "cache", str(timestamp))
+        return _join_key(cls.DASHBOARD, "cache", str(timestamp))
     
     @classmethod
     def dashboard_config(cls, user_id: str) -> str:
@@ -178,6 +225,7 @@ class RedisPubSubChannels:
     METRICS_UPDATED = "kcloud:events:metrics:updated"
     METRICS_BATCH = "kcloud:events:metrics:batch"
     
+    # payload: {"cluster_name": ...}, sent when a cluster's status or health_status changes
     CLUSTER_STATUS_CHANGED = "kcloud:events:cluster:status"
     CLUSTER_CREATED = "kcloud:events:cluster:created"
     CLUSTER_DELETED = "kcloud:events:cluster:deleted"
@@ -197,33 +245,51 @@ class RedisPubSubChannels:
         return f"kcloud:notifications:user:{user_id}:*"
 
 
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Payloads are encoded with orjson when it is installed; datetimes are passed
+# through as-is and formatted by the encoder
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=_json_default)
+    _loads = json.loads
+
+
 class RedisDataTypes:
     """
     
     @staticmethod
     def serialize_cluster_metrics(metrics: Dict[str, Any]) -> str:
         """
-        return json.dumps({
+        return _dumps({
             **metrics,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             '_type': 'cluster_metrics'
         })
     
     @staticmethod
     def deserialize_cluster_metrics(data: str) -> Dict[str, Any]:
         """
-        return json.loads(data)
+        return _loads(data)
     
     @staticmethod
     def create_alert_payload(alert_id: str, cluster_name: str,
                            severity: str, message: str, metadata: Dict = None) -> str:
         """
-        return json.dumps({
+        return _dumps({
             'alert_id': alert_id,
             'cluster_name': cluster_name,
             'severity': severity,
             'message': message,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'metadata': metadata or {},
             '_type': 'alert'
         })
@@ -232,20 +298,22 @@ class RedisDataTypes:
     def create_dashboard_cache(clusters_data: Dict, summary: Dict,
                              alerts_count: int) -> str:
         """
-        return json.dumps({
-            'clusters': clusters_data,
-            'summary': summary,
-            'alerts_count': alerts_count,
-            'generated_at': datetime.now().isoformat(),
-            'expires_at': (datetime.now() + timedelta(seconds=30)).isoformat(),
-            '_type': 'dashboard_cache'
-        })
+        # Fixed envelope: only the variable parts go through the encoder
+        now = datetime.now()
+        return (
+            f'{{"clusters":{_dumps(clusters_data)},'
+            f'"summary":{_dumps(summary)},'
+            f'"alerts_count":{int(alerts_count)},'
+            f'"generated_at":"{now.isoformat()}",'
+            f'"expires_at":"{(now + timedelta(seconds=30)).isoformat()}",'
+            f'"_type":"dashboard_cache"}}'
+        )
     
     @staticmethod
     def hash_query_params(**params) -> str:
         """
         param_str = json.dumps(params, sort_keys=True)
-        return hashlib.md5(param_str.encode()).hexdigest()
+        return hashlib.blake2b(param_str.encode(), digest_size=16).hexdigest()
 
 
 class RedisExpirePolicy:
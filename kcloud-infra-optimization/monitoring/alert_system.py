@@ -2,25 +2,134 @@
 """
 """
 
+import ast
+import atexit
+import os
 import sys
+import threading
 import time
+import itertools
 import json
+import operator
 import smtplib
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from dataclasses import dataclass, asdict, field
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+import numpy as np
 try:
-    from infrastructure.monitoring.metrics_collector import ClusterMetrics
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from infrastructure.monitoring.metrics_collector import ClusterMetrics, ClusterMetricsBuffer
 except ImportError:
     try:
-        from .metrics_collector import ClusterMetrics
+        from .metrics_collector import ClusterMetrics, ClusterMetricsBuffer
     except ImportError:
         raise ImportError("ClusterMetrics not found. Please ensure it's in PYTHONPATH")
 
+try:
+    from infrastructure.database.redis_keys import RedisKeys, RedisPubSubChannels, RedisDataTypes, RedisExpirePolicy
+except ImportError:
+    from database.redis_keys import RedisKeys, RedisPubSubChannels, RedisDataTypes, RedisExpirePolicy
+
+# Shared by every AlertSystem; threads are only started on first use
+_EVAL_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                thread_name_prefix="alert-eval")
+
+# Shared globals for evaluating rule conditions; builtins are not exposed
+_EVAL_GLOBALS = {"__builtins__": {}}
+
+# Variables available to rule conditions; each is a ClusterMetrics attribute
+_EVAL_FIELDS = frozenset((
+    'cluster_name', 'status', 'cost_per_hour', 'health_score', 'efficiency_score',
+    'failed_pods', 'pending_pods', 'cpu_usage', 'memory_usage', 'gpu_usage',
+    'power_consumption_watts', 'node_count'
+))
+
+
+class _MetricsAttributeAccess(ast.NodeTransformer):
+    """Rewrite condition variable names into attribute loads on the metrics argument"""
+    
+    def visit_Name(self, node):
+        if node.id not in _EVAL_FIELDS:
+            raise ValueError(f"unknown condition variable: {node.id}")
+        return ast.copy_location(
+            ast.Attribute(value=ast.Name(id='m', ctx=ast.Load()), attr=node.id, ctx=ast.Load()),
+            node
+        )
+
+
+def _compile_predicate(condition: str, rule_name: str) -> Optional[Callable]:
+    """Compile a condition into "lambda m: ..." reading ClusterMetrics attributes
+
+    Returns None when the condition uses anything but the known variables.
+    """
+    try:
+        body = _MetricsAttributeAccess().visit(ast.parse(condition, mode='eval').body)
+    except (SyntaxError, ValueError):
+        return None
+    
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg='m')], vararg=None,
+                         kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+    tree = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=args, body=body)))
+    return eval(compile(tree, f"<rule:{rule_name}>", "eval"), _EVAL_GLOBALS)
+
+
+_COMPARE_OPS = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne
+}
+
+
+def _parse_comparison(node) -> Optional[Tuple[str, Callable, Any]]:
+    if not (isinstance(node, ast.Compare) and len(node.ops) == 1
+            and isinstance(node.left, ast.Name)
+            and isinstance(node.comparators[0], ast.Constant)
+            and type(node.ops[0]) in _COMPARE_OPS):
+        return None
+    return node.left.id, _COMPARE_OPS[type(node.ops[0])], node.comparators[0].value
+
+
+def _parse_threshold(condition: str) -> Optional[Tuple[Optional[str], Optional[Callable], Any, Optional[str]]]:
+    """Reduce a rule condition to (field, op, threshold, required_status)
+
+    Handles "<field> <op> <number>", "status == '<value>'" and the two joined
+    with "and". Returns None for anything else; such rules are evaluated row by row.
+    """
+    try:
+        node = ast.parse(condition, mode='eval').body
+    except SyntaxError:
+        return None
+    
+    parts = node.values if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And) else [node]
+    if len(parts) > 2:
+        return None
+    
+    field_name, op, threshold, status = None, None, None, None
+    for part in parts:
+        parsed = _parse_comparison(part)
+        if parsed is None:
+            return None
+        name, part_op, value = parsed
+        if name == 'status' and part_op is operator.eq and isinstance(value, str) and status is None:
+            status = value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and field_name is None:
+            field_name, op, threshold = name, part_op, value
+        else:
+            return None
+    return field_name, op, threshold, status
+
 @dataclass
 class AlertRule:
     """
@@ -30,6 +139,25 @@ class AlertRule:
     message_template: str
     cooldown_minutes: int = 5
     enabled: bool = True
+    # condition compiled once, so evaluation does not re-parse the string
+    compiled: Any = field(default=None, init=False, repr=False, compare=False)
+    # (field, op, threshold, required_status) for conditions simple enough to vectorize
+    threshold: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    # condition as a function of the ClusterMetrics object, when it only uses known variables
+    predicate: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
+    cooldown_seconds: float = field(default=0.0, init=False, repr=False, compare=False)
+    # metric names the condition reads, so rules can be skipped when one is missing
+    fields: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.compiled = compile(self.condition, f"<rule:{self.name}>", "eval")
+        self.fields = tuple(sorted({
+            node.id for node in ast.walk(ast.parse(self.condition, mode='eval'))
+            if isinstance(node, ast.Name)
+        }))
+        self.threshold = _parse_threshold(self.condition)
+        self.predicate = _compile_predicate(self.condition, self.name)
+        self.cooldown_seconds = self.cooldown_minutes * 60.0
 
 @dataclass
 class Alert:
@@ -42,94 +170,111 @@ class Alert:
     timestamp: str
     acknowledged: bool = False
     resolved: bool = False
+    # timestamp as a Unix epoch, so expiry checks compare floats instead of parsing
+    ts_epoch: float = 0.0
     
     def to_dict(self) -> Dict:
         return asdict(self)
 
+# Built once at import; rules are shared, each AlertSystem gets its own list
+_DEFAULT_RULES = (
+    AlertRule(
+        name="high_cost",
+        condition="cost_per_hour > 20.0",
+        severity="WARNING",
+        cooldown_minutes=10
+    ),
+    AlertRule(
+        name="very_high_cost",
+        condition="cost_per_hour > 50.0",
+        severity="CRITICAL",
+        cooldown_minutes=5
+    ),
+    AlertRule(
+        name="low_health",
+        condition="health_score < 50.0 and status == 'CREATE_COMPLETE'",
+        severity="WARNING",
+        cooldown_minutes=15
+    ),
+    AlertRule(
+        name="critical_health",
+        condition="health_score < 20.0 and status == 'CREATE_COMPLETE'",
+        severity="CRITICAL",
+        cooldown_minutes=5
+    ),
+    AlertRule(
+        name="failed_pods",
+        condition="failed_pods > 0",
+        severity="WARNING",
+        cooldown_minutes=10
+    ),
+    AlertRule(
+        name="many_failed_pods",
+        condition="failed_pods > 5",
+        severity="CRITICAL",
+        cooldown_minutes=5
+    ),
+    AlertRule(
+        name="high_cpu",
+        condition="cpu_usage > 90.0 and status == 'CREATE_COMPLETE'",
+        severity="WARNING",
+        cooldown_minutes=15
+    ),
+    AlertRule(
+        name="high_memory",
+        condition="memory_usage > 90.0 and status == 'CREATE_COMPLETE'",
+        severity="WARNING",
+        cooldown_minutes=15
+    ),
+    AlertRule(
+        name="low_efficiency",
+        condition="efficiency_score < 30.0 and status == 'CREATE_COMPLETE'",
+        severity="INFO",
+        cooldown_minutes=30
+    ),
+    AlertRule(
+        name="cluster_creation_failed",
+        condition="status == 'CREATE_FAILED'",
+        severity="CRITICAL",
+        cooldown_minutes=0
+    ),
+    AlertRule(
+        name="high_power_consumption",
+        condition="power_consumption_watts > 5000.0",
+        severity="INFO",
+        cooldown_minutes=60
+    )
+)
+
 class AlertSystem:
     """
     
-    def __init__(self):
+    def __init__(self, redis_client=None):
         self.alert_rules = []
+        # Optional synchronous redis.Redis client; alerts are published there when set
+        self.redis_client = redis_client
         self.active_alerts = []
         self.alert_history = []
-        self.last_alert_time = defaultdict(datetime)
+        # Last fire epoch per (rule, cluster); -inf means never fired
+        self._rule_idx: Dict[str, int] = {}
+        self._cluster_idx: Dict[str, int] = {}
+        self._last_fire = np.full((16, 64), -np.inf)
+        self._iso_cache = (None, "")
         self.notification_handlers = []
+        # Indices over unresolved alerts, maintained by _index_alert/_unindex_alert
+        self._by_id: Dict[str, Alert] = {}
+        self._by_severity: Dict[str, Dict[str, Alert]] = defaultdict(dict)
+        self._cluster_counts: Counter = Counter()
+        # Guards active_alerts, the alert indices and the _last_fire cooldowns
+        # across process_metrics* callers; rule matching and I/O run outside it
+        self._lock = threading.Lock()
         
 
         self.setup_default_rules()
         
     def setup_default_rules(self):
         """
-        default_rules = [
-            AlertRule(
-                name="high_cost",
-                condition="cost_per_hour > 20.0",
-                severity="WARNING",
-                cooldown_minutes=10
-            ),
-            AlertRule(
-                name="very_high_cost",
-                condition="cost_per_hour > 50.0",
-                severity="CRITICAL",
-                cooldown_minutes=5
-            ),
-            AlertRule(
-                name="low_health",
-                condition="health_score < 50.0 and status == 'CREATE_COMPLETE'",
-                severity="WARNING",
-                cooldown_minutes=15
-            ),
-            AlertRule(
-                name="critical_health",
-                condition="health_score < 20.0 and status == 'CREATE_COMPLETE'",
-                severity="CRITICAL",
-                cooldown_minutes=5
-            ),
-            AlertRule(
-                name="failed_pods",
-                condition="failed_pods > 0",
-                severity="WARNING",
-                cooldown_minutes=10
-            ),
-            AlertRule(
-                name="many_failed_pods",
-                condition="failed_pods > 5",
-                severity="CRITICAL",
-                cooldown_minutes=5
-            ),
-            AlertRule(
-                name="high_cpu",
-                condition="cpu_usage > 90.0 and status == 'CREATE_COMPLETE'",
-                severity="WARNING",
-                cooldown_minutes=15
-            ),
-            AlertRule(
-                name="high_memory",
-                condition="memory_usage > 90.0 and status == 'CREATE_COMPLETE'",
-                severity="WARNING",
-                cooldown_minutes=15
-            ),
-            AlertRule(
-                name="low_efficiency",
-                condition="efficiency_score < 30.0 and status == 'CREATE_COMPLETE'",
-                severity="INFO",
-                cooldown_minutes=30
-            ),
-            AlertRule(
-                name="cluster_creation_failed",
-                condition="status == 'CREATE_FAILED'",
-                severity="CRITICAL",
-                cooldown_minutes=0
-            ),
-            AlertRule(
-                name="high_power_consumption",
-                condition="power_consumption_watts > 5000.0",
-                severity="INFO",
-                cooldown_minutes=60
-            )
-        ]
-        self.alert_rules = default_rules
+        self.alert_rules = list(_DEFAULT_RULES)
     def add_rule(self, rule: AlertRule):
 """
         """self.alert_rules.append(rule)
@@ -137,10 +282,26 @@ class AlertSystem:
     def remove_rule(self, rule_name: str):
 """
         self.alert_rules = [r for r in self.alert_rules if r.name != rule_name]
-    def evaluate_conditions(self, metrics: ClusterMetrics) -> List[Alert]:
+    def evaluate_conditions(self, metrics: ClusterMetrics, now: Optional[float] = None) -> List[Alert]:
 """
         """triggered_alerts = []
-        current_time = datetime.now()
+        if now is None:
+            now = time.time()
+        
+        matched_rules, eval_vars = self._match_rules(metrics)
+        with self._lock:
+            for rule in matched_rules:
+                alert = self._fire(rule, metrics, eval_vars, now)
+                if alert is not None:
+                    triggered_alerts.append(alert)
+        
+        return triggered_alerts
+    
+    def _match_rules(self, metrics: ClusterMetrics) -> Tuple[List[AlertRule], Optional[Dict[str, Any]]]:
+        """Rules whose condition holds for metrics; touches no shared state"""
+        matched_rules = []
+        # Only needed for rules without a predicate and for message formatting
+        eval_vars = None
         
         for rule in self.alert_rules:
             if not rule.enabled:
@@ -148,132 +309,323 @@ class AlertSystem:
             
             try:
 
-                eval_vars = {
-                    'cluster_name': metrics.cluster_name,
-                    'status': metrics.status,
-                    'cost_per_hour': metrics.cost_per_hour,
-                    'health_score': metrics.health_score,
-                    'efficiency_score': metrics.efficiency_score,
-                    'failed_pods': metrics.failed_pods,
-                    'pending_pods': metrics.pending_pods,
-                    'cpu_usage': metrics.cpu_usage,
-                    'memory_usage': metrics.memory_usage,
-                    'gpu_usage': metrics.gpu_usage,
-                    'power_consumption_watts': metrics.power_consumption_watts,
-                    'node_count': metrics.node_count
-                }
-                
-
-                if eval(rule.condition, {"__builtins__": {}}, eval_vars):
-
-                    alert_key = f"{rule.name}_{metrics.cluster_name}"
-                    last_alert = self.last_alert_time.get(alert_key, datetime.min)
-                    
-                    if current_time - last_alert >= timedelta(minutes=rule.cooldown_minutes):
-
-                        alert_message = rule.message_template.format(**eval_vars)
-                        
-                        alert = Alert(
-                            id=f"{alert_key}_{int(current_time.timestamp())}",
-                            rule_name=rule.name,
-                            cluster_name=metrics.cluster_name,
-                            severity=rule.severity,
-                            message=alert_message,
-                            timestamp=current_time.isoformat()
-                        )
-                        
-                        triggered_alerts.append(alert)
-                        self.last_alert_time[alert_key] = current_time
+                if rule.predicate is not None:
+                    matched = rule.predicate(metrics)
+                else:
+                    if eval_vars is None:
+                        eval_vars = self._build_eval_vars(metrics)
+                    matched = eval(rule.compiled, _EVAL_GLOBALS, eval_vars)
+
+                if matched:
+                    matched_rules.append(rule)
                         
             except Exception as e:
         
-        return triggered_alerts
+        if matched_rules and eval_vars is None:
+            eval_vars = self._build_eval_vars(metrics)
+        return matched_rules, eval_vars
+    
+    @staticmethod
+    def _build_eval_vars(metrics: ClusterMetrics) -> Dict[str, Any]:
+        return {
+            'cluster_name': metrics.cluster_name,
+            'status': metrics.status,
+            'cost_per_hour': metrics.cost_per_hour,
+            'health_score': metrics.health_score,
+            'efficiency_score': metrics.efficiency_score,
+            'failed_pods': metrics.failed_pods,
+            'pending_pods': metrics.pending_pods,
+            'cpu_usage': metrics.cpu_usage,
+            'memory_usage': metrics.memory_usage,
+            'gpu_usage': metrics.gpu_usage,
+            'power_consumption_watts': metrics.power_consumption_watts,
+            'node_count': metrics.node_count
+        }
+    
+    def _fire(self, rule: AlertRule, metrics: ClusterMetrics, eval_vars: Dict[str, Any],
+              now: float) -> Optional[Alert]:
+        """Create the alert for a matched rule unless it is still cooling down"""
+        slot = self._cooldown_slot(rule.name, metrics.cluster_name)
+        
+        if now - self._last_fire[slot] < rule.cooldown_seconds:
+            return None
+
+        alert_message = rule.message_template.format(**eval_vars)
+        
+        alert_key = f"{rule.name}_{metrics.cluster_name}"
+        alert = Alert(
+            id=f"{alert_key}_{int(now)}",
+            rule_name=rule.name,
+            cluster_name=metrics.cluster_name,
+            severity=rule.severity,
+            message=alert_message,
+            timestamp=self._iso(now),
+            ts_epoch=now
+        )
+        
+        self._last_fire[slot] = now
+        return alert
+    
+    def _iso(self, epoch: float) -> str:
+        """ISO string for epoch, formatted once and shared by all alerts of a tick"""
+        if self._iso_cache[0] != epoch:
+            self._iso_cache = (epoch, datetime.fromtimestamp(epoch).isoformat())
+        return self._iso_cache[1]
+    
+    def _cooldown_slot(self, rule_name: str, cluster_name: str) -> Tuple[int, int]:
+        ri = self._rule_idx.get(rule_name)
+        if ri is None:
+            ri = self._rule_idx[rule_name] = len(self._rule_idx)
+        ci = self._cluster_idx.get(cluster_name)
+        if ci is None:
+            ci = self._cluster_idx[cluster_name] = len(self._cluster_idx)
+        
+        rows, cols = self._last_fire.shape
+        if ri >= rows or ci >= cols:
+            # Grow geometrically so new rules/clusters rarely reallocate
+            grown = np.full((rows * 2 if ri >= rows else rows, cols * 2 if ci >= cols else cols), -np.inf)
+            grown[:rows, :cols] = self._last_fire
+            self._last_fire = grown
+        return ri, ci
+    
+    def evaluate_matrix(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Evaluate every rule against a batch of metrics stored column-wise
+
+        columns maps each condition variable to an array with one entry per
+        cluster. Returns a (clusters x rules) boolean matrix in alert_rules order;
+        cooldowns are not applied. Threshold rules are compared with NumPy over
+        the whole column, other rules fall back to per-row evaluation.
+        """
+        n = len(next(iter(columns.values()))) if columns else 0
+        matrix = np.zeros((n, len(self.alert_rules)), dtype=bool)
+        
+        for r, rule in enumerate(self.alert_rules):
+            if not rule.enabled or n == 0:
+                continue
+            
+            if rule.threshold is not None and self._has_columns(rule.threshold, columns):
+                field_name, op, threshold, status = rule.threshold
+                mask = np.ones(n, dtype=bool)
+                if field_name is not None:
+                    mask &= op(columns[field_name], threshold)
+                if status is not None:
+                    mask &= columns['status'] == status
+                matrix[:, r] = mask
+                continue
+            
+            for i in range(n):
+                row = {name: column[i].item() if isinstance(column[i], np.generic) else column[i]
+                       for name, column in columns.items()}
+                try:
+                    matrix[i, r] = bool(eval(rule.compiled, _EVAL_GLOBALS, row))
+                except Exception:
+                    pass
+        
+        return matrix
+    
+    @staticmethod
+    def _has_columns(threshold: Tuple, columns: Dict[str, np.ndarray]) -> bool:
+        field_name, _, _, status = threshold
+        return ((field_name is None or field_name in columns)
+                and (status is None or 'status' in columns))
     
     def process_metrics(self, metrics: ClusterMetrics):
 """
-        triggered_alerts = self.evaluate_conditions(metrics)
+        now = time.time()
+        triggered_alerts = self.evaluate_conditions(metrics, now)
+        self._dispatch_alerts(triggered_alerts, now)
+        return triggered_alerts
+    
+    def process_metrics_batch(self, buffer: ClusterMetricsBuffer) -> List[Alert]:
+        """Evaluate a whole batch of clusters with evaluate_matrix
+
+        Produces the same alerts, in the same order, as calling process_metrics
+        once per cluster with the batch contents.
+        """
+        triggered_alerts = []
+        now = time.time()
+        matrix = self.evaluate_matrix(buffer.columns())
+        
+        eval_vars = None
+        last_row = -1
+        with self._lock:
+            for row, r in zip(*(idx.tolist() for idx in np.nonzero(matrix))):
+                metrics = buffer.metrics[row]
+                if row != last_row:
+                    eval_vars = self._build_eval_vars(metrics)
+                    last_row = row
+                try:
+                    alert = self._fire(self.alert_rules[r], metrics, eval_vars, now)
+                except Exception as e:
+                    print(f"[ALERT] Rule {self.alert_rules[r].name} failed: {e}")
+                    continue
+                if alert is not None:
+                    triggered_alerts.append(alert)
+        
+        self._dispatch_alerts(triggered_alerts, now)
+        return triggered_alerts
+    
+    def process_metrics_parallel(self, metrics_list: List[ClusterMetrics]) -> List[Alert]:
+        """Evaluate many clusters on the thread pool
+
+        Conditions are checked concurrently; cooldowns and alert creation run
+        under the lock. Alerts are returned in completion order.
+        """
+        triggered_alerts = []
+        now = time.time()
+        futures = {_EVAL_POOL.submit(self._match_rules, m): m for m in metrics_list}
+        
+        for future in as_completed(futures):
+            metrics = futures[future]
+            matched_rules, eval_vars = future.result()
+            if not matched_rules:
+                continue
+            with self._lock:
+                for rule in matched_rules:
+                    try:
+                        alert = self._fire(rule, metrics, eval_vars, now)
+                    except Exception as e:
+                        print(f"[ALERT] Rule {rule.name} failed: {e}")
+                        continue
+                    if alert is not None:
+                        triggered_alerts.append(alert)
+        
+        self._dispatch_alerts(triggered_alerts, now)
+        return triggered_alerts
+    
+    def _dispatch_alerts(self, triggered_alerts: List[Alert], now: float):
+        """Record alerts under the lock, then notify and publish outside it"""
+        with self._lock:
+            for alert in triggered_alerts:
+                self.active_alerts.append(alert)
+                self._index_alert(alert)
+                self.alert_history.append(alert)
+        self.cleanup_resolved_alerts(now)
+        
         for alert in triggered_alerts:
-            self.active_alerts.append(alert)
-            self.alert_history.append(alert)
             print(f"[ALERT] [{alert.severity}] {alert.message}")
             for handler in self.notification_handlers:
                 try:
                     handler(alert)
                 except Exception as e:
-        self.cleanup_resolved_alerts()
-        return triggered_alerts
-    def cleanup_resolved_alerts(self):
+        if triggered_alerts and self.redis_client is not None:
+            self._redis_publish(triggered_alerts)
+    
+    def _redis_publish(self, alerts: List[Alert]):
+        """Write and announce alerts in a single pipelined round-trip"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for alert in alerts:
+            payload = RedisDataTypes.create_alert_payload(
+                alert.id, alert.cluster_name, alert.severity, alert.message,
+                {'rule_name': alert.rule_name, 'timestamp': alert.timestamp}
+            )
+            pipe.zadd(RedisKeys.alerts_active(),
+                      {alert.id: alert.ts_epoch or datetime.fromisoformat(alert.timestamp).timestamp()})
+            pipe.sadd(RedisKeys.alerts_by_cluster(alert.cluster_name), alert.id)
+            pipe.sadd(RedisKeys.alerts_clusters(), alert.cluster_name)
+            pipe.sadd(RedisKeys.alerts_by_severity(alert.severity), alert.id)
+            pipe.setex(RedisKeys.alert_detail(alert.id), RedisExpirePolicy.ALERTS_ACTIVE, payload)
+            pipe.publish(RedisPubSubChannels.ALERTS_NEW, payload)
+        try:
+            pipe.execute()
+        except Exception as e:
+            print(f"[ALERT] Redis publish failed: {e}")
+    def cleanup_resolved_alerts(self, now: Optional[float] = None):
 """
         """
 
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        
-        for alert in self.active_alerts:
-            alert_time = datetime.fromisoformat(alert.timestamp.replace('Z', ''))
-            if alert_time < cutoff_time:
-                alert.resolved = True
+        cutoff = (time.time() if now is None else now) - 24 * 3600
         
+        with self._lock:
+            for alert in self.active_alerts:
+                # Alerts built outside evaluate_conditions may not carry an epoch
+                alert_epoch = alert.ts_epoch or datetime.fromisoformat(alert.timestamp.replace('Z', '')).timestamp()
+                if alert_epoch < cutoff:
+                    alert.resolved = True
+                    self._unindex_alert(alert)
+            
 
-        self.active_alerts = [a for a in self.active_alerts if not a.resolved]
+            self.active_alerts = [a for a in self.active_alerts if not a.resolved]
+    
+    def _index_alert(self, alert: Alert):
+        # Alerts sharing an id (same rule, cluster and second) keep the first one indexed
+        if alert.id in self._by_id:
+            return
+        self._by_id[alert.id] = alert
+        self._by_severity[alert.severity][alert.id] = alert
+        self._cluster_counts[alert.cluster_name] += 1
+    
+    def _unindex_alert(self, alert: Alert):
+        if self._by_id.get(alert.id) is not alert:
+            return
+        del self._by_id[alert.id]
+        self._by_severity[alert.severity].pop(alert.id, None)
+        self._cluster_counts[alert.cluster_name] -= 1
+        if self._cluster_counts[alert.cluster_name] <= 0:
+            del self._cluster_counts[alert.cluster_name]
     
     def acknowledge_alert(self, alert_id: str):
         """
-        for alert in self.active_alerts:
-            if alert.id == alert_id:
-                alert.acknowledged = True
-                return True
-        return False
+        alert = self._by_id.get(alert_id)
+        if alert is None:
+            return False
+        alert.acknowledged = True
+        return True
     def resolve_alert(self, alert_id: str):
 """
-        """for alert in self.active_alerts:
-            if alert.id == alert_id:
-                alert.resolved = True
-                return True
-        return False
+        """alert = self._by_id.get(alert_id)
+        if alert is None:
+            return False
+        alert.resolved = True
+        self._unindex_alert(alert)
+        return True
     
     def get_active_alerts(self, severity: Optional[str] = None) -> List[Alert]:
 """
-        alerts = [a for a in self.active_alerts if not a.resolved]
-        
         if severity:
-            alerts = [a for a in alerts if a.severity == severity]
+            return list(self._by_severity.get(severity, {}).values())
         
-        return alerts
+        return list(self._by_id.values())
     
     def get_alert_summary(self) -> Dict:
         """
-        active_alerts = self.get_active_alerts()
+        recent = list(itertools.islice(reversed(self._by_id.values()), 10))
+        recent.reverse()
         
         summary = {
             'timestamp': datetime.now().isoformat(),
-            'total_active': len(active_alerts),
+            'total_active': len(self._by_id),
             'by_severity': {
-                'CRITICAL': len([a for a in active_alerts if a.severity == 'CRITICAL']),
-                'WARNING': len([a for a in active_alerts if a.severity == 'WARNING']),
-                'INFO': len([a for a in active_alerts if a.severity == 'INFO'])
+                'CRITICAL': len(self._by_severity.get('CRITICAL', ())),
+                'WARNING': len(self._by_severity.get('WARNING', ())),
+                'INFO': len(self._by_severity.get('INFO', ()))
             },
-            'by_cluster': {},
-            'recent_alerts': [a.to_dict() for a in active_alerts[-10:]]
+            'by_cluster': dict(self._cluster_counts),
+            'recent_alerts': [a.to_dict() for a in recent]
         }
         
-
-        for alert in active_alerts:
-            cluster = alert.cluster_name
-            if cluster not in summary['by_cluster']:
-                summary['by_cluster'][cluster] = 0
-            summary['by_cluster'][cluster] += 1
-        
         return summary
     
     def add_notification_handler(self, handler: Callable[[Alert], None]):
         """
         self.notification_handlers.append(handler)
-    def save_alert_history(self, filename: Optional[str] = None):
+    def save_alert_history(self, filename: Optional[str] = None, pretty: bool = False):
 """
         """if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"alert_history_{timestamp}.json"
         
+        if orjson is not None:
+            # orjson encodes the Alert dataclasses directly, without asdict copies
+            data = {
+                'export_time': datetime.now(),
+                'alert_count': len(self.alert_history),
+                'alerts': self.alert_history
+            }
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+            return
+        
         data = {
             'export_time': datetime.now().isoformat(),
             'alert_count': len(self.alert_history),
@@ -281,28 +633,56 @@ class AlertSystem:
         }
         
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, indent=2 if pretty else None)
         
 
+SEVERITY_ICONS = {
+    'INFO': 'ℹ️',
+    'WARNING': '⚠️',
+    'CRITICAL': '🚨'
+}
+
 def console_handler(alert: Alert):
 """
-    severity_icons = {
-        'INFO': 'ℹ️',
-        'WARNING': '⚠️',
-        'CRITICAL': '🚨'
-    }
-    
-    icon = severity_icons.get(alert.severity, '❓')
-    timestamp = datetime.fromisoformat(alert.timestamp).strftime('%H:%M:%S')
+    icon = SEVERITY_ICONS.get(alert.severity, '❓')
+    if alert.ts_epoch:
+        timestamp = time.strftime('%H:%M:%S', time.localtime(alert.ts_epoch))
+    else:
+        timestamp = datetime.fromisoformat(alert.timestamp).strftime('%H:%M:%S')
     print(f"{icon} [{timestamp}] {alert.message}")
 
+# file_handler keeps the log open and writes lines in batches
+ALERT_LOG_FILE = 'kcloud_alerts.log'
+LOG_FLUSH_LINES = 64
+LOG_FLUSH_INTERVAL = 1.0
+_log_fh = None
+_log_buf: List[str] = []
+_log_last_flush = 0.0
+
+
+def flush_alert_log():
+    """Write buffered file_handler lines to the alert log"""
+    global _log_fh, _log_last_flush
+    _log_last_flush = time.monotonic()
+    if not _log_buf:
+        return
+    if _log_fh is None:
+        _log_fh = open(ALERT_LOG_FILE, 'a', buffering=1 << 16)
+    _log_fh.writelines(_log_buf)
+    _log_fh.flush()
+    _log_buf.clear()
+
+
+atexit.register(flush_alert_log)
+
+
 def file_handler(alert: Alert):
     """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{alert.severity}] {alert.cluster_name}: {alert.message}\n"
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(alert.ts_epoch or None))
+    _log_buf.append(f"[{timestamp}] [{alert.severity}] {alert.cluster_name}: {alert.message}\n")
     
-    with open('kcloud_alerts.log', 'a') as f:
-        f.write(log_entry)
+    if len(_log_buf) >= LOG_FLUSH_LINES or time.monotonic() - _log_last_flush > LOG_FLUSH_INTERVAL:
+        flush_alert_log()
 
 def webhook_handler(alert: Alert):
     """
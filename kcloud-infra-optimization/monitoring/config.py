@@ -4,6 +4,7 @@
 
 import os
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 @dataclass
@@ -64,6 +65,8 @@ CLUSTER_TEMPLATES = {
         estimated_power_per_node=500.0
     )
 }
+# Read-only live view over CLUSTER_TEMPLATES, so later changes stay visible
+_TEMPLATES = MappingProxyType(CLUSTER_TEMPLATES)
 
 openstack_config = OpenStackConfig()
 monitoring_config = MonitoringConfig()
@@ -96,7 +99,17 @@ def get_cluster_template(template_name: str) -> Optional[ClusterTemplate]:
     Returns:
         ClusterTemplate if found, None otherwise
     """
-    return CLUSTER_TEMPLATES.get(template_name)
+    return _TEMPLATES.get(template_name)
+
+# (environment variable, config, attribute, converter) applied by update_config_from_env
+_ENV_OVERRIDES = (
+    ('OS_AUTH_URL', 'openstack', 'auth_url', str),
+    ('OS_USERNAME', 'openstack', 'username', str),
+    ('OS_PASSWORD', 'openstack', 'password', str),
+    ('OS_PROJECT_NAME', 'openstack', 'project_name', str),
+    ('MONITORING_UPDATE_INTERVAL', 'monitoring', 'update_interval', int),
+    ('HIGH_COST_THRESHOLD', 'monitoring', 'high_cost_threshold', float),
+)
 
 def update_config_from_env() -> None:
     """
@@ -107,21 +120,11 @@ def update_config_from_env() -> None:
     """
     global openstack_config, monitoring_config
     
-
-    if os.getenv('OS_AUTH_URL'):
-        openstack_config.auth_url = os.getenv('OS_AUTH_URL')
-    if os.getenv('OS_USERNAME'):
-        openstack_config.username = os.getenv('OS_USERNAME')
-    if os.getenv('OS_PASSWORD'):
-        openstack_config.password = os.getenv('OS_PASSWORD')
-    if os.getenv('OS_PROJECT_NAME'):
-        openstack_config.project_name = os.getenv('OS_PROJECT_NAME')
-    
-
-    if os.getenv('MONITORING_UPDATE_INTERVAL'):
-        monitoring_config.update_interval = int(os.getenv('MONITORING_UPDATE_INTERVAL'))
-    if os.getenv('HIGH_COST_THRESHOLD'):
-        monitoring_config.high_cost_threshold = float(os.getenv('HIGH_COST_THRESHOLD'))
+    env = os.environ
+    for env_name, target, attr, convert in _ENV_OVERRIDES:
+        value = env.get(env_name)
+        if value:
+            setattr(openstack_config if target == 'openstack' else monitoring_config, attr, convert(value))
 
 # 초기화 시 환경 변수 로드
 update_config_from_env()
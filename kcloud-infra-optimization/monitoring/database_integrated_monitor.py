@@ -3,23 +3,26 @@
 """
 import sys
 import json
+import time
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from contextlib import asynccontextmanager
 try:
     from infrastructure.database.connection import get_database_manager, init_database, close_database
     from infrastructure.monitoring.enhanced_metrics_collector import EnhancedMetricsCollector, EnhancedClusterMetrics
+    from infrastructure.monitoring.metrics_collector import ClusterMetricsBuffer
     from infrastructure.monitoring.enhanced_alert_system import EnhancedAlertSystem, EnhancedAlert
-    from infrastructure.database.redis_keys import RedisKeys, RedisPubSubChannels, RedisDataTypes
+    from infrastructure.database.redis_keys import RedisKeys, RedisPubSubChannels, RedisDataTypes, RedisExpirePolicy
     from infrastructure.monitoring.realtime_dashboard import RealTimeDashboard
 except ImportError:
     try:
         from database.connection import get_database_manager, init_database, close_database
         from enhanced_metrics_collector import EnhancedMetricsCollector, EnhancedClusterMetrics
+        from metrics_collector import ClusterMetricsBuffer
         from enhanced_alert_system import EnhancedAlertSystem, EnhancedAlert
-        from database.redis_keys import RedisKeys, RedisPubSubChannels, RedisDataTypes
+        from database.redis_keys import RedisKeys, RedisPubSubChannels, RedisDataTypes, RedisExpirePolicy
         from realtime_dashboard import RealTimeDashboard
     except ImportError:
         raise ImportError("Required modules not found. Please ensure they're in PYTHONPATH or install the package")
@@ -32,13 +35,49 @@ except ImportError:
         IntegratedMonitor = None
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+
+# Monitor statistics; the view keeps the same columns and is refreshed in the
+# background, so ticks read one precomputed row instead of re-counting
+_STATS_COLUMNS = """
+    (SELECT count(*) FROM cluster_metrics WHERE time >= NOW() - INTERVAL '1 hour') as metrics_1h,
+    (SELECT count(*) FROM clusters) as total_clusters,
+    (SELECT count(*) FROM alerts WHERE triggered_at >= NOW() - INTERVAL '24 hours') as alerts_24h,
+    (SELECT pg_database_size(current_database())) as db_size_bytes
+"""
+STATS_VIEW = "mv_monitor_stats"
+_STATS_VIEW_DDL = (
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS {STATS_VIEW} AS SELECT 1 AS id, {_STATS_COLUMNS}",
+    # REFRESH ... CONCURRENTLY requires a unique index
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {STATS_VIEW}_id ON {STATS_VIEW} (id)",
+)
+
+
+def _emit(lines: List[str]):
+    """Write a block of console lines with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 class DatabaseIntegratedMonitor:
 """
     """
     
-    def __init__(self, update_interval: int = 30, use_database: bool = True):
+    # INFO is expensive on the Redis side, so its result is reused for this long
+    INFO_CACHE_TTL = 30.0
+    # Seconds between background refreshes of the statistics view
+    STATS_VIEW_REFRESH = 60.0
+    # Metrics are persisted by a background writer in batches of up to
+    # WRITE_BATCH_ROWS, or whatever arrived within WRITE_FLUSH_INTERVAL seconds
+    WRITE_QUEUE_SIZE = 4096
+    WRITE_BATCH_ROWS = 1000
+    WRITE_FLUSH_INTERVAL = 0.5
+    
+    def __init__(self, update_interval: int = 30, use_database: bool = True,
+                 alert_concurrency: int = 16):
         self.update_interval = update_interval
         self.use_database = use_database
+        # Caps how many clusters are in alert processing at once
+        self._alert_semaphore = asyncio.Semaphore(alert_concurrency)
         self.running = False
         
 
@@ -54,6 +93,16 @@ class DatabaseIntegratedMonitor:
         self.last_health_check = None
         self.error_count = 0
         self.max_errors = 5
+        # (monotonic time, stats) of the last successful _get_database_stats call
+        self._db_stats_cache = (0.0, None)
+        self._info_cache = (0.0, None)
+        # Most recent metrics per cluster, so a partial refresh still summarizes every cluster
+        self._latest_metrics: Dict[str, EnhancedClusterMetrics] = {}
+        # Set once the statistics view exists; until then the stats are queried directly
+        self._stats_view_ready = False
+        self._stats_refresh_task: Optional[asyncio.Task] = None
+        self.write_q: asyncio.Queue = asyncio.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def initialize(self):
         """
@@ -74,12 +123,16 @@ class DatabaseIntegratedMonitor:
             self.db_manager = await init_database()
             
 
-            self.metrics_collector = EnhancedMetricsCollector(self.db_manager)
             self.alert_system = EnhancedAlertSystem(self.db_manager)
-            await self.alert_system.initialize()
-            
-
-            self.dashboard = RealTimeDashboard(self.update_interval)
+            # The collector and dashboard build their OpenStack clients synchronously,
+            # so they are set up on worker threads while the alert rules load
+            self.metrics_collector, self.dashboard, _, _ = await asyncio.gather(
+                asyncio.to_thread(EnhancedMetricsCollector, self.db_manager),
+                asyncio.to_thread(RealTimeDashboard, self.update_interval),
+                self.alert_system.initialize(),
+                self._setup_stats_view()
+            )
+            self._writer_task = asyncio.create_task(self._writer_loop())
             
             
         except Exception as e:
@@ -91,27 +144,40 @@ class DatabaseIntegratedMonitor:
             self.fallback_monitor = IntegratedMonitor(self.update_interval)
         except Exception as e:
             raise
-    async def monitor_clusters_enhanced(self, cluster_names: List[str]) -> Dict[str, Any]:
+    async def monitor_clusters_enhanced(self, cluster_names: List[str],
+                                        changed: Optional[List[str]] = None) -> Dict[str, Any]:
 """
         """if not self.use_database or not self.db_manager:
             return await self._monitor_clusters_fallback(cluster_names)
         
         try:
-            
+            # One timestamp for everything this tick reports
+            tick_ts = datetime.now().isoformat()
 
-            metrics_list = await self.metrics_collector.collect_multiple_clusters_async(cluster_names)
-            
-
-            all_alerts = []
-            for metrics in metrics_list:
-                alerts = await self.alert_system.process_metrics_alerts(metrics)
-                all_alerts.extend(alerts)
-            
-
-            summary = await self._generate_enhanced_summary(metrics_list, all_alerts)
+            # Only the changed clusters are collected and alerted on; the rest keep
+            # their latest metrics in the summary
+            collected = await self.metrics_collector.collect_multiple_clusters_async(
+                cluster_names if changed is None else changed,
+                store_to_database=self._writer_task is None
+            )
+            if changed is None:
+                # Full sweep: clusters no longer monitored drop out of the cache
+                for name in self._latest_metrics.keys() - set(cluster_names):
+                    del self._latest_metrics[name]
+            for m in collected:
+                self._latest_metrics[m.cluster_name] = m
+            if self._writer_task is not None:
+                self._enqueue_writes(collected)
+            metrics_list = [self._latest_metrics[name] for name in cluster_names
+                            if name in self._latest_metrics]
             
-
-            await self._update_dashboard_cache(summary)
+            if self.db_manager.is_connected:
+                # Alert writes share one round-trip, the dashboard cache another
+                async with self.db_manager.redis_pipeline() as pipe:
+                    summary = await self._process_tick(collected, metrics_list, pipe, tick_ts)
+                    await self._flush_tick_writes(pipe, summary)
+            else:
+                summary = await self._process_tick(collected, metrics_list, None, tick_ts)
             
             self.error_count = 0
             return summary
@@ -121,30 +187,104 @@ class DatabaseIntegratedMonitor:
             
 
             if self.error_count >= self.max_errors:
-                return await self._monitor_clusters_fallback(cluster_names)
+                return await self._monitor_clusters_fallback(cluster_names, tick_ts)
             
-            return await self._generate_error_summary(str(e))
+            return await self._generate_error_summary(str(e), tick_ts)
+    
+    async def _process_tick(self, collected: List[EnhancedClusterMetrics],
+                            metrics_list: List[EnhancedClusterMetrics], pipe,
+                            tick_ts: str) -> Dict[str, Any]:
+        """Alert on the collected metrics, writing alerts through pipe, and summarize metrics_list"""
+        per_cluster_alerts = await asyncio.gather(
+            *(self._process_alerts_bounded(m, pipe) for m in collected),
+            return_exceptions=True
+        )
+        all_alerts = []
+        for metrics, alerts in zip(collected, per_cluster_alerts):
+            if isinstance(alerts, Exception):
+                logger.error(f"Alert processing failed for {metrics.cluster_name}: {alerts}")
+                continue
+            all_alerts.extend(alerts)
+        
+        # Sent before the summary so its alert counts include this tick's alerts
+        if pipe is not None and all_alerts:
+            try:
+                await pipe.execute()
+            except Exception as e:
+                logger.error(f"Redis alert writes failed: {e}")
+        
+        return await self._generate_enhanced_summary(metrics_list, all_alerts, tick_ts)
+    
+    def _enqueue_writes(self, metrics_list: List[EnhancedClusterMetrics]):
+        """Hand collected samples to the background writer without waiting on Postgres"""
+        for m in metrics_list:
+            if m.data_source == "error_handler":
+                continue
+            try:
+                self.write_q.put_nowait(m)
+            except asyncio.QueueFull:
+                logger.warning(f"Metrics write queue full, dropping sample for {m.cluster_name}")
+    
+    async def _writer_loop(self):
+        """Persist queued metrics with COPY in batches until the None sentinel arrives"""
+        loop = asyncio.get_running_loop()
+        stop = False
+        while not stop:
+            item = await self.write_q.get()
+            batch = []
+            deadline = loop.time() + self.WRITE_FLUSH_INTERVAL
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                remaining = deadline - loop.time()
+                if len(batch) >= self.WRITE_BATCH_ROWS or remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.write_q.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if batch:
+                try:
+                    await self.metrics_collector.store_many_to_database(batch)
+                except Exception as e:
+                    logger.error(f"Background metrics write of {len(batch)} rows failed: {e}")
     
-    async def _monitor_clusters_fallback(self, cluster_names: List[str]) -> Dict[str, Any]:
+    async def _process_alerts_bounded(self, metrics: EnhancedClusterMetrics, pipe) -> List[EnhancedAlert]:
+        async with self._alert_semaphore:
+            return await self.alert_system.process_metrics_alerts(metrics, pipe)
+    
+    async def _monitor_clusters_fallback(self, cluster_names: List[str],
+                                         tick_ts: Optional[str] = None) -> Dict[str, Any]:
 """
         if not self.fallback_monitor:
             await self._initialize_fallback_system()
         cluster_metrics = self.fallback_monitor.monitor_clusters(cluster_names)
+        clusters, summary = self._generate_basic_summary(cluster_metrics)
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': tick_ts or datetime.now().isoformat(),
             'mode': 'fallback',
-            'clusters': {name: metrics.to_dict() for name, metrics in cluster_metrics.items()},
-            'summary': self._generate_basic_summary(cluster_metrics),
+            'clusters': clusters,
+            'summary': summary,
             'alerts': {'total_active': 0, 'recent_alerts': []},
             'recommendations': self._generate_basic_recommendations(cluster_metrics)
         }
     async def _generate_enhanced_summary(self, metrics_list: List[EnhancedClusterMetrics],
-                                       alerts: List[EnhancedAlert]) -> Dict[str, Any]:
+                                       alerts: List[EnhancedAlert],
+                                       tick_ts: Optional[str] = None) -> Dict[str, Any]:
 """
         """
-        total_cost = sum(m.cost_per_hour for m in metrics_list)
-        total_power = sum(m.power_consumption_watts for m in metrics_list)
-        active_clusters = len([m for m in metrics_list if m.status == 'CREATE_COMPLETE'])
+        # Single pass over the clusters for every summary total
+        total_cost = total_power = health_sum = efficiency_sum = 0.0
+        active_clusters = 0
+        for m in metrics_list:
+            total_cost += m.cost_per_hour
+            total_power += m.power_consumption_watts
+            if m.status == 'CREATE_COMPLETE':
+                active_clusters += 1
+                health_sum += m.health_score
+                efficiency_sum += m.efficiency_score
         
 
         alert_summary = await self.alert_system.get_alert_summary()
@@ -153,7 +293,7 @@ class DatabaseIntegratedMonitor:
         performance_analysis = await self._analyze_cluster_performance(metrics_list)
         
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': tick_ts or datetime.now().isoformat(),
             'mode': 'database_integrated',
             'clusters': {m.cluster_name: m.to_db_dict() for m in metrics_list},
             'summary': {
@@ -161,8 +301,8 @@ class DatabaseIntegratedMonitor:
                 'total_power_consumption': total_power,
                 'active_clusters': active_clusters,
                 'total_clusters': len(metrics_list),
-                'avg_health_score': sum(m.health_score for m in metrics_list if m.status == 'CREATE_COMPLETE') / max(active_clusters, 1),
-                'avg_efficiency_score': sum(m.efficiency_score for m in metrics_list if m.status == 'CREATE_COMPLETE') / max(active_clusters, 1)
+                'avg_health_score': health_sum / max(active_clusters, 1),
+                'avg_efficiency_score': efficiency_sum / max(active_clusters, 1)
             },
             'alerts': alert_summary,
             'performance': performance_analysis,
@@ -172,31 +312,40 @@ class DatabaseIntegratedMonitor:
     
     async def _analyze_cluster_performance(self, metrics_list: List[EnhancedClusterMetrics]) -> Dict[str, Any]:
         """
-        active_metrics = [m for m in metrics_list if m.status == 'CREATE_COMPLETE']
+        # One columnar snapshot, then every statistic is a vectorized reduction
+        columns = ClusterMetricsBuffer(metrics_list).columns()
+        active = columns['status'] == 'CREATE_COMPLETE'
         
-        if not active_metrics:
+        if not active.any():
             return {'status': 'no_active_clusters'}
         
+        names = columns['cluster_name'][active]
+        cpu = columns['cpu_usage'][active]
+        memory = columns['memory_usage'][active]
+        cost = columns['cost_per_hour'][active]
+        efficiency = columns['efficiency_score'][active]
+        health = columns['health_score'][active]
+        
         analysis = {
             'cpu': {
-                'avg': sum(m.cpu_usage for m in active_metrics) / len(active_metrics),
-                'max': max(m.cpu_usage for m in active_metrics),
-                'min': min(m.cpu_usage for m in active_metrics)
+                'avg': float(cpu.mean()),
+                'max': float(cpu.max()),
+                'min': float(cpu.min())
             },
             'memory': {
-                'avg': sum(m.memory_usage for m in active_metrics) / len(active_metrics),
-                'max': max(m.memory_usage for m in active_metrics),
-                'min': min(m.memory_usage for m in active_metrics)
+                'avg': float(memory.mean()),
+                'max': float(memory.max()),
+                'min': float(memory.min())
             },
             'cost_efficiency': {
-                'cost_per_performance': sum(m.cost_per_hour / max(m.efficiency_score, 1) for m in active_metrics) / len(active_metrics),
-                'high_cost_clusters': [m.cluster_name for m in active_metrics if m.cost_per_hour > 10.0],
-                'low_efficiency_clusters': [m.cluster_name for m in active_metrics if m.efficiency_score < 40.0]
+                'cost_per_performance': float((cost / efficiency.clip(min=1)).mean()),
+                'high_cost_clusters': names[cost > 10.0].tolist(),
+                'low_efficiency_clusters': names[efficiency < 40.0].tolist()
             },
             'health_trends': {
-                'healthy_clusters': len([m for m in active_metrics if m.health_score > 80]),
-                'warning_clusters': len([m for m in active_metrics if 50 <= m.health_score <= 80]),
-                'critical_clusters': len([m for m in active_metrics if m.health_score < 50])
+                'healthy_clusters': int((health > 80).sum()),
+                'warning_clusters': int(((health >= 50) & (health <= 80)).sum()),
+                'critical_clusters': int((health < 50).sum())
             }
         }
         
@@ -241,20 +390,18 @@ class DatabaseIntegratedMonitor:
         if not self.db_manager or not self.db_manager.is_connected:
             return {'status': 'disconnected'}
         
+        cached_at, cached = self._db_stats_cache
+        if cached is not None and time.monotonic() - cached_at < self.update_interval:
+            return cached
+        
         try:
 
-            pg_stats = await self.db_manager.execute_query(
-                """
-                SELECT
-                    (SELECT count(*) FROM cluster_metrics WHERE time >= NOW() - INTERVAL '1 hour') as metrics_1h,
-                    (SELECT count(*) FROM clusters) as total_clusters,
-                    (SELECT count(*) FROM alerts WHERE triggered_at >= NOW() - INTERVAL '24 hours') as alerts_24h,
-                    (SELECT pg_database_size(current_database())) as db_size_bytes
-                """
-                fetch='one'
-            )
-            redis_info = await self.db_manager.redis_client.info()
-            return {
+            if self._stats_view_ready:
+                pg_query = self.db_manager.fetch_one(f"SELECT * FROM {STATS_VIEW}")
+            else:
+                pg_query = self.db_manager.fetch_one(f"SELECT {_STATS_COLUMNS}")
+            pg_stats, redis_info = await asyncio.gather(pg_query, self._redis_info())
+            stats = {
                 'status': 'connected',
                 'postgresql': {
                     'metrics_last_hour': pg_stats['metrics_1h'],
@@ -268,9 +415,39 @@ class DatabaseIntegratedMonitor:
                     'hit_rate': f"{redis_info.get('keyspace_hit_rate', 0):.2f}%"
                 }
             }
+            self._db_stats_cache = (time.monotonic(), stats)
+            return stats
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
-    async def _update_dashboard_cache(self, summary: Dict[str, Any]):
+    async def _setup_stats_view(self):
+        """Create the statistics view and start refreshing it; failures keep the direct query"""
+        try:
+            for statement in _STATS_VIEW_DDL:
+                await self.db_manager.execute(statement)
+        except Exception as e:
+            logger.warning(f"Statistics view unavailable, querying directly: {e}")
+            return
+        self._stats_view_ready = True
+        self._stats_refresh_task = asyncio.create_task(self._refresh_stats_view_loop())
+    
+    async def _refresh_stats_view_loop(self):
+        while True:
+            await asyncio.sleep(self.STATS_VIEW_REFRESH)
+            try:
+                await self.db_manager.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATS_VIEW}")
+            except Exception as e:
+                logger.warning(f"Statistics view refresh failed: {e}")
+    
+    async def _redis_info(self) -> Dict[str, Any]:
+        """Memory and keyspace sections of Redis INFO, cached for INFO_CACHE_TTL seconds"""
+        fetched_at, info = self._info_cache
+        now = time.monotonic()
+        if info is None or now - fetched_at > self.INFO_CACHE_TTL:
+            info = await self.db_manager.redis_client.info('memory', 'keyspace')
+            self._info_cache = (now, info)
+        return info
+    
+    async def _flush_tick_writes(self, pipe, summary: Dict[str, Any]):
 """
         """try:
             cache_data = RedisDataTypes.create_dashboard_cache(
@@ -279,37 +456,87 @@ class DatabaseIntegratedMonitor:
                 summary['alerts']['total_active']
             )
             
-            await self.db_manager.redis_set(
+            pipe.set(
                 RedisKeys.dashboard_cache(),
                 cache_data,
-                RedisExpirePolicy.DASHBOARD_CACHE
+                ex=RedisExpirePolicy.DASHBOARD_CACHE
             )
+            pipe.publish(RedisPubSubChannels.DASHBOARD_REFRESH, summary['timestamp'])
+            await pipe.execute()
             
         except Exception as e:
     
     async def run_continuous_monitoring(self, cluster_names: List[str]):
 """
         self.running = True
+        pubsub = await self._subscribe_cluster_events()
+        last_full_refresh = -float('inf')
         try:
             while self.running:
-                print(f"\n{'='*80}")
+                # Full sweep every update_interval; in between, only clusters
+                # announced on the status channel are refreshed
+                elapsed = time.monotonic() - last_full_refresh
+                if elapsed >= self.update_interval:
+                    changed = None
+                    last_full_refresh = time.monotonic()
+                else:
+                    changed = await self._wait_for_changed_clusters(
+                        pubsub, cluster_names, self.update_interval - elapsed
+                    )
+                    if not changed:
+                        continue
+                header = [f"\n{'='*80}"]
                 if self.use_database and self.db_manager:
                 else:
-                print('='*80)
-                summary = await self.monitor_clusters_enhanced(cluster_names)
-                self._print_monitoring_summary(summary)
+                header.append('='*80)
+                # Console writes run off the event loop so a slow terminal cannot stall it
+                await asyncio.to_thread(_emit, header)
+                summary = await self.monitor_clusters_enhanced(cluster_names, changed)
+                await asyncio.to_thread(self._print_monitoring_summary, summary)
                 if datetime.now() - (self.last_health_check or datetime.min) > timedelta(minutes=5):
                     await self._perform_health_check()
-                await asyncio.sleep(self.update_interval)
         except KeyboardInterrupt:
             self.running = False
         except Exception as e:
             self.running = False
+        finally:
+            if pubsub is not None:
+                await pubsub.reset()
+    
+    async def _subscribe_cluster_events(self):
+        """Subscribe to cluster status changes, or return None without Redis"""
+        if not self.use_database or not self.db_manager or not self.db_manager.is_connected:
+            return None
+        try:
+            pubsub = self.db_manager.redis_client.pubsub()
+            await pubsub.subscribe(RedisPubSubChannels.CLUSTER_STATUS_CHANGED)
+            return pubsub
+        except Exception as e:
+            logger.warning(f"Cluster event subscription failed, polling only: {e}")
+            return None
+    
+    async def _wait_for_changed_clusters(self, pubsub, cluster_names: List[str],
+                                         timeout: float) -> List[str]:
+        """Monitored clusters announced as changed within timeout seconds"""
+        if pubsub is None:
+            await asyncio.sleep(timeout)
+            return []
+        changed = set()
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        while message is not None:
+            try:
+                changed.add(json.loads(message['data'])['cluster_name'])
+            except (ValueError, KeyError, TypeError):
+                pass
+            # Drain whatever else already arrived so a burst becomes one refresh
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
+        return sorted(changed.intersection(cluster_names))
     def _print_monitoring_summary(self, summary: Dict[str, Any]):
 """
         """if not summary.get('clusters'):
             return
         
+        lines = []
 
         summary_data = summary['summary']
         
@@ -333,7 +560,10 @@ class DatabaseIntegratedMonitor:
         recommendations = summary.get('recommendations', [])
         if recommendations:
             for rec in recommendations[:3]:
-                print(f"  - {rec}")
+                lines.append(f"  - {rec}")
+        
+        if lines:
+            _emit(lines)
     
     async def _perform_health_check(self):
 """
@@ -347,17 +577,47 @@ class DatabaseIntegratedMonitor:
 """
         """self.running = False
         
+        if self._stats_refresh_task is not None:
+            self._stats_refresh_task.cancel()
+            self._stats_refresh_task = None
+        
+        # Let the writer flush what is queued before the pool closes
+        if self._writer_task is not None:
+            if not self._writer_task.done():
+                try:
+                    self.write_q.put_nowait(None)
+                except asyncio.QueueFull:
+                    # No room for the sentinel; drop the backlog rather than hang shutdown
+                    self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Metrics writer stopped with an error: {e}")
+            self._writer_task = None
+        
         if self.db_manager:
             await close_database()
         
     
 
-    def _generate_basic_summary(self, cluster_metrics: Dict) -> Dict[str, Any]:
+    def _generate_basic_summary(self, cluster_metrics: Dict) -> Tuple[Dict[str, Any], Dict[str, Any]]:
 """
-        return {
-            'total_cost_per_hour': sum(m.cost_per_hour for m in cluster_metrics.values()),
-            'total_power_consumption': sum(m.power_consumption_watts for m in cluster_metrics.values()),
-            'active_clusters': len([m for m in cluster_metrics.values() if m.status == 'CREATE_COMPLETE']),
+        clusters = {}
+        total_cost = total_power = 0.0
+        active_clusters = 0
+        for name, m in cluster_metrics.items():
+            clusters[name] = m.to_dict()
+            total_cost += m.cost_per_hour
+            total_power += m.power_consumption_watts
+            if m.status == 'CREATE_COMPLETE':
+                active_clusters += 1
+        
+        return clusters, {
+            'total_cost_per_hour': total_cost,
+            'total_power_consumption': total_power,
+            'active_clusters': active_clusters,
             'total_clusters': len(cluster_metrics)
         }
     
@@ -375,10 +635,10 @@ class DatabaseIntegratedMonitor:
         
         return recommendations
     
-    async def _generate_error_summary(self, error_msg: str) -> Dict[str, Any]:
+    async def _generate_error_summary(self, error_msg: str, tick_ts: Optional[str] = None) -> Dict[str, Any]:
 """
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': tick_ts or datetime.now().isoformat(),
             'mode': 'error',
             'error': error_msg,
             'clusters': {},
@@ -7,8 +7,13 @@ import uuid
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from functools import cached_property
+from typing import Dict, List, Mapping, Optional, Any, Callable
 from dataclasses import dataclass, asdict
+try:
+    import orjson
+except ImportError:
+    orjson = None
 try:
     from infrastructure.monitoring.alert_system import AlertSystem as BaseAlertSystem, Alert, AlertRule
     from infrastructure.monitoring.enhanced_metrics_collector import EnhancedClusterMetrics
@@ -24,6 +29,38 @@ except ImportError:
         raise ImportError("Required modules not found. Please ensure they're in PYTHONPATH or install the package")
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+
+# orjson when available; _dumps stays str-typed for the alerts.metadata parameter
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+ALERT_INSERT_QUERY = """
+    INSERT INTO alerts (
+        id, rule_id, cluster_name, severity, message,
+        triggered_at, metadata
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7
+    ) ON CONFLICT (id) DO NOTHING
+"""
+
+
+def _alert_record(alert: 'EnhancedAlert') -> tuple:
+    """Order an alert's fields to match ALERT_INSERT_QUERY"""
+    return (
+        alert.alert_uuid,
+        alert.rule_uuid,
+        alert.cluster_name,
+        alert.severity,
+        alert.message,
+        alert.timestamp,
+        alert.metadata_json
+    )
+
 @dataclass
 class EnhancedAlert(Alert):
 """
@@ -43,6 +80,31 @@ class EnhancedAlert(Alert):
         if not self.notification_channels:
             self.notification_channels = []
     
+    # Encoded on first use and reused by every handler that stores or sends the alert
+    @cached_property
+    def redis_payload(self) -> str:
+        """Detail/pubsub payload of the alert"""
+        return RedisDataTypes.create_alert_payload(
+            self.alert_uuid, self.cluster_name,
+            self.severity, self.message,
+            {'rule_name': self.rule_name, 'timestamp': self.timestamp}
+        )
+    
+    @cached_property
+    def metadata_json(self) -> str:
+        """JSON of the alerts.metadata column"""
+        return _dumps(self._metadata())
+    
+    def _metadata(self) -> Dict[str, Any]:
+        return {
+            'rule_uuid': self.rule_uuid,
+            'cluster_uuid': self.cluster_uuid,
+            'escalation_level': self.escalation_level,
+            'auto_resolve_at': self.auto_resolve_at,
+            'notification_channels': self.notification_channels,
+            'original_id': self.id
+        }
+    
     def to_db_dict(self) -> Dict[str, Any]:
         """
         return {
@@ -54,14 +116,7 @@ class EnhancedAlert(Alert):
             'triggered_at': self.timestamp,
             'acknowledged': self.acknowledged,
             'resolved': self.resolved,
-            'metadata': {
-                'rule_uuid': self.rule_uuid,
-                'cluster_uuid': self.cluster_uuid,
-                'escalation_level': self.escalation_level,
-                'auto_resolve_at': self.auto_resolve_at,
-                'notification_channels': self.notification_channels,
-                'original_id': self.id
-            }
+            'metadata': self._metadata()
         }
 
 class EnhancedAlertSystem:
@@ -88,7 +143,7 @@ class EnhancedAlertSystem:
                 self.base_system.setup_default_rules()
                 return
             
-            rules = await self.db_manager.execute_query(
+            rules = await self.db_manager.fetch_all(
                 "SELECT * FROM alert_rules WHERE is_enabled = true ORDER BY name"
             )
             
@@ -122,7 +177,8 @@ class EnhancedAlertSystem:
             self._redis_handler,
             self._database_handler
         ]
-    async def process_metrics_alerts(self, metrics: EnhancedClusterMetrics) -> List[EnhancedAlert]:
+    async def process_metrics_alerts(self, metrics: EnhancedClusterMetrics,
+                                     pipe=None) -> List[EnhancedAlert]:
 """
         """try:
 
@@ -132,8 +188,23 @@ class EnhancedAlertSystem:
             triggered_alerts = await self._evaluate_alert_conditions(metrics)
             
 
-            for alert in triggered_alerts:
-                await self._process_single_alert(alert)
+            db_records = [] if self.db_manager.is_connected else None
+            if pipe is not None or not triggered_alerts or not self.db_manager.is_connected:
+                # Without Redis the console and other channels still get every alert
+                for alert in triggered_alerts:
+                    await self._process_single_alert(alert, pipe, db_records)
+            else:
+                # Redis writes for every alert of this evaluation share one round-trip
+                async with self.db_manager.redis_client.pipeline(transaction=False) as own_pipe:
+                    for alert in triggered_alerts:
+                        await self._process_single_alert(alert, own_pipe, db_records)
+                    try:
+                        await own_pipe.execute()
+                    except Exception as e:
+                        logger.error(f"Redis alert writes failed for {metrics.cluster_name}: {e}")
+            
+            if db_records:
+                await self._store_alert_records(metrics.cluster_name, db_records)
             
             return triggered_alerts
             
@@ -151,58 +222,65 @@ class EnhancedAlertSystem:
         current_time = datetime.now()
         
 
-        rules_to_check = self.alert_rules_cache if self.alert_rules_cache else self.base_system.alert_rules
+        candidates = [
+            rule_data for rule_data in (self.alert_rules_cache.values() if self.alert_rules_cache
+                                        else [{'rule': r, 'uuid': None} for r in self.base_system.alert_rules])
+            if rule_data['rule'].enabled
+        ]
+        if not candidates:
+            return triggered_alerts
+        
+        # Every rule's cooldown is checked with one MGET instead of a GET per rule
+        cooldown_keys = [RedisKeys.alert_cooldown(d['rule'].name, metrics.cluster_name) for d in candidates]
+        if self.db_manager.is_connected:
+            cooldowns = await self.db_manager.redis_mget(cooldown_keys)
+        else:
+            # Without Redis no cooldown can be recorded, so every rule is evaluated
+            cooldowns = [None] * len(cooldown_keys)
+        started_cooldowns = []
+        eval_vars = self._prepare_eval_vars(metrics)
         
-        for rule_name, rule_data in (self.alert_rules_cache.items() if self.alert_rules_cache
-                                   else [(r.name, {'rule': r, 'uuid': None}) for r in self.base_system.alert_rules]):
+        for rule_data, cooldown_key, cooldown in zip(candidates, cooldown_keys, cooldowns):
+            if cooldown is not None:
+                continue
             
             rule = rule_data['rule']
-            if not rule.enabled:
+            # A rule reading a field this sample lacks or left unset cannot match
+            if any(eval_vars.get(name) is None for name in rule.fields):
                 continue
-            
             try:
 
-                cooldown_key = RedisKeys.alert_cooldown(rule.name, metrics.cluster_name)
-                is_in_cooldown = await self.db_manager.redis_get(cooldown_key) is not None
-                
-                if is_in_cooldown:
-                    continue
-                
-
-                eval_vars = self._prepare_eval_vars(metrics)
-                if eval(rule.condition, {"__builtins__": {}}, eval_vars):
-
+                # Conditions are compiled once by AlertRule; no per-tick parsing
+                if rule.predicate is not None:
+                    matched = rule.predicate(metrics)
+                else:
+                    matched = eval(rule.compiled, {"__builtins__": {}}, eval_vars)
+                if matched:
                     alert = self._create_enhanced_alert(rule, rule_data.get('uuid'), metrics, eval_vars)
                     triggered_alerts.append(alert)
                     
 
                     if rule.cooldown_minutes > 0:
-                        await self.db_manager.redis_set(
-                            cooldown_key,
-                            current_time.isoformat(),
-                            RedisExpirePolicy.alert_cooldown_ttl(rule.cooldown_minutes)
+                        started_cooldowns.append(
+                            (cooldown_key, RedisExpirePolicy.alert_cooldown_ttl(rule.cooldown_minutes))
                         )
                 
             except Exception as e:
         
+        if started_cooldowns and self.db_manager.is_connected:
+            try:
+                async with self.db_manager.redis_client.pipeline(transaction=False) as pipe:
+                    for cooldown_key, ttl in started_cooldowns:
+                        pipe.set(cooldown_key, current_time.isoformat(), ex=ttl)
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(f"Failed to start alert cooldowns for {metrics.cluster_name}: {e}")
+        
         return triggered_alerts
     
-    def _prepare_eval_vars(self, metrics: EnhancedClusterMetrics) -> Dict[str, Any]:
+    def _prepare_eval_vars(self, metrics: EnhancedClusterMetrics) -> Mapping[str, Any]:
 """
-        return {
-            'cluster_name': metrics.cluster_name,
-            'status': metrics.status,
-            'cost_per_hour': metrics.cost_per_hour,
-            'health_score': metrics.health_score,
-            'efficiency_score': metrics.efficiency_score,
-            'failed_pods': metrics.failed_pods,
-            'pending_pods': metrics.pending_pods,
-            'cpu_usage': metrics.cpu_usage,
-            'memory_usage': metrics.memory_usage,
-            'gpu_usage': metrics.gpu_usage,
-            'power_consumption_watts': metrics.power_consumption_watts,
-            'node_count': metrics.node_count
-        }
+        return metrics.eval_view
     
     def _create_enhanced_alert(self, rule: AlertRule, rule_uuid: Optional[str],
                              metrics: EnhancedClusterMetrics, eval_vars: Dict) -> EnhancedAlert:
@@ -221,11 +299,18 @@ class EnhancedAlertSystem:
             notification_channels=['console', 'redis', 'database']
         )
     
-    async def _process_single_alert(self, alert: EnhancedAlert):
+    async def _process_single_alert(self, alert: EnhancedAlert, pipe=None,
+                                    db_records: Optional[List[tuple]] = None):
         """
         try:
             for handler in self.notification_handlers:
-                await handler(alert)
+                # With a caller-owned pipeline the Redis writes are queued, not sent
+                if pipe is not None and handler == self._redis_handler:
+                    self._queue_alert_writes(pipe, alert)
+                elif db_records is not None and handler == self._database_handler:
+                    db_records.append(_alert_record(alert))
+                else:
+                    await handler(alert)
             logger.info(f"[ALERT] [{alert.severity}] {alert.cluster_name}: {alert.message}")
         except Exception as e:
     async def _console_handler(self, alert: EnhancedAlert):
@@ -240,39 +325,28 @@ class EnhancedAlertSystem:
         timestamp = datetime.fromisoformat(alert.timestamp).strftime('%H:%M:%S')
         print(f"{icon} [{timestamp}] {alert.message}")
     
+    def _queue_alert_writes(self, pipe, alert: EnhancedAlert):
+        """Queue the Redis writes of _redis_handler on pipe; the caller executes it"""
+        pipe.zadd(
+            RedisKeys.alerts_active(),
+            {alert.alert_uuid: datetime.fromisoformat(alert.timestamp).timestamp()}
+        )
+        pipe.sadd(RedisKeys.alerts_by_cluster(alert.cluster_name), alert.alert_uuid)
+        pipe.sadd(RedisKeys.alerts_clusters(), alert.cluster_name)
+        pipe.sadd(RedisKeys.alerts_by_severity(alert.severity), alert.alert_uuid)
+        # The stored detail is also what subscribers receive
+        payload = alert.redis_payload
+        pipe.set(RedisKeys.alert_detail(alert.alert_uuid), payload, ex=RedisExpirePolicy.ALERTS_ACTIVE)
+        pipe.publish(RedisPubSubChannels.ALERTS_NEW, payload)
+    
     async def _redis_handler(self, alert: EnhancedAlert):
         """
         try:
-            alert_score = datetime.fromisoformat(alert.timestamp).timestamp()
-            await self.db_manager.redis_client.zadd(
-                RedisKeys.alerts_active(),
-                {alert.alert_uuid: alert_score}
-            )
-            await self.db_manager.redis_client.sadd(
-                RedisKeys.alerts_by_cluster(alert.cluster_name),
-                alert.alert_uuid
-            )
-            await self.db_manager.redis_client.sadd(
-                RedisKeys.alerts_by_severity(alert.severity),
-                alert.alert_uuid
-            )
-            alert_detail_key = f"kcloud:alert:detail:{alert.alert_uuid}"
-            await self.db_manager.redis_set(
-                alert_detail_key,
-                RedisDataTypes.create_alert_payload(
-                    alert.alert_uuid, alert.cluster_name,
-                    alert.severity, alert.message,
-                    {'rule_name': alert.rule_name, 'timestamp': alert.timestamp}
-                ),
-                RedisExpirePolicy.ALERTS_ACTIVE
-            )
-            await self.db_manager.redis_publish(
-                RedisPubSubChannels.ALERTS_NEW,
-                RedisDataTypes.create_alert_payload(
-                    alert.alert_uuid, alert.cluster_name,
-                    alert.severity, alert.message
-                )
-            )
+            if not self.db_manager.is_connected:
+                return
+            async with self.db_manager.redis_client.pipeline(transaction=False) as pipe:
+                self._queue_alert_writes(pipe, alert)
+                await pipe.execute()
         except Exception as e:
     async def _database_handler(self, alert: EnhancedAlert):
 """
@@ -282,26 +356,17 @@ class EnhancedAlertSystem:
                 return
             
 
-            await self.db_manager.execute_query(
-                """
-                INSERT INTO alerts (
-                    id, rule_id, cluster_name, severity, message,
-                    triggered_at, metadata
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7
-                ) ON CONFLICT (id) DO NOTHING
-                """,
-                alert.alert_uuid,
-                alert.rule_uuid,
-                alert.cluster_name,
-                alert.severity,
-                alert.message,
-                alert.timestamp,
-                json.dumps(alert.to_db_dict()['metadata'])
-            )
+            await self.db_manager.execute(ALERT_INSERT_QUERY, *_alert_record(alert))
             
         except Exception as e:
     
+    async def _store_alert_records(self, cluster_name: str, records: List[tuple]):
+        """Insert the alerts of one evaluation with a single executemany"""
+        try:
+            await self.db_manager.execute_many(ALERT_INSERT_QUERY, records)
+        except Exception as e:
+            logger.error(f"Alert inserts failed for {cluster_name}: {e}")
+    
     async def get_active_alerts(self, cluster_name: str = None,
                               severity: str = None, limit: int = 100) -> List[Dict[str, Any]]:
 """
@@ -318,12 +383,11 @@ class EnhancedAlertSystem:
                 alert_ids = await self.db_manager.redis_client.zrevrange(
                     RedisKeys.alerts_active(), 0, limit - 1
                 )
-            alerts = []
-            for alert_id in alert_ids:
-                detail_key = f"kcloud:alert:detail:{alert_id}"
-                alert_data = await self.db_manager.redis_get(detail_key)
-                if alert_data:
-                    alerts.append(json.loads(alert_data))
+            # one MGET for every detail key instead of a GET per alert
+            details = await self.db_manager.redis_mget(
+                [RedisKeys.alert_detail(alert_id) for alert_id in alert_ids]
+            )
+            alerts = [_loads(alert_data) for alert_data in details if alert_data]
             return alerts[:limit]
         except Exception as e:
             return []
@@ -336,7 +400,7 @@ class EnhancedAlertSystem:
             
 
             if self.db_manager.is_connected:
-                await self.db_manager.execute_query(
+                await self.db_manager.execute(
                     """
                     UPDATE alerts SET
                         acknowledged_at = NOW(),
@@ -354,24 +418,35 @@ class EnhancedAlertSystem:
     async def get_alert_summary(self) -> Dict[str, Any]:
 """
         try:
-            total_active = await self.db_manager.redis_client.zcard(RedisKeys.alerts_active())
+            redis_client = self.db_manager.redis_client
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zcard(RedisKeys.alerts_active())
+                pipe.scard(RedisKeys.alerts_by_severity('CRITICAL'))
+                pipe.scard(RedisKeys.alerts_by_severity('WARNING'))
+                pipe.scard(RedisKeys.alerts_by_severity('INFO'))
+                # Indexed set instead of KEYS, which would block Redis on a large keyspace
+                pipe.smembers(RedisKeys.alerts_clusters())
+                total_active, critical, warning, info, cluster_names = await pipe.execute()
             summary = {
                 'timestamp': datetime.now().isoformat(),
                 'total_active': total_active,
                 'by_severity': {
-                    'CRITICAL': await self.db_manager.redis_client.scard(RedisKeys.alerts_by_severity('CRITICAL')),
-                    'WARNING': await self.db_manager.redis_client.scard(RedisKeys.alerts_by_severity('WARNING')),
-                    'INFO': await self.db_manager.redis_client.scard(RedisKeys.alerts_by_severity('INFO'))
+                    'CRITICAL': critical,
+                    'WARNING': warning,
+                    'INFO': info
                 },
                 'by_cluster': {},
                 'recent_alerts': []
             }
-            cluster_keys = await self.db_manager.redis_client.keys(RedisKeys.alerts_by_cluster("*"))
-            for key in cluster_keys[:10]:
-                cluster_name = key.split(":")[-1]
-                count = await self.db_manager.redis_client.scard(key)
-                if count > 0:
-                    summary['by_cluster'][cluster_name] = count
+            cluster_names = sorted(cluster_names)[:10]
+            if cluster_names:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for cluster_name in cluster_names:
+                        pipe.scard(RedisKeys.alerts_by_cluster(cluster_name))
+                    counts = await pipe.execute()
+                for cluster_name, count in zip(cluster_names, counts):
+                    if count > 0:
+                        summary['by_cluster'][cluster_name] = count
             summary['recent_alerts'] = await self.get_active_alerts(limit=5)
             return summary
         except Exception as e:
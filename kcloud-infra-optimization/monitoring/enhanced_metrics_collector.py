@@ -3,11 +3,17 @@
 """
 import sys
 import json
+import time
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 from dataclasses import dataclass, asdict
+try:
+    import orjson
+except ImportError:
+    orjson = None
 try:
     from infrastructure.monitoring.metrics_collector import MetricsCollector as BaseMetricsCollector, ClusterMetrics
     from infrastructure.database.connection import get_database_manager, DatabaseManager
@@ -21,6 +27,43 @@ except ImportError:
         raise ImportError("Required modules not found. Please ensure they're in PYTHONPATH or install the package")
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+
+# JSON is encoded with orjson when it is installed; strings are kept because the
+# results feed asyncpg json parameters as well as Redis
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _dumps = json.dumps
+
+# cluster_metrics columns written per sample, in insert/COPY order
+METRICS_COLUMNS = (
+    'time', 'cluster_name', 'cluster_id', 'status', 'health_status',
+    'node_count', 'master_count', 'cpu_usage', 'memory_usage', 'gpu_usage',
+    'disk_usage', 'network_io_mbps', 'running_pods', 'failed_pods', 'pending_pods',
+    'workload_count', 'power_consumption_watts', 'cost_per_hour',
+    'estimated_monthly_cost', 'health_score', 'efficiency_score', 'metadata'
+)
+
+METRICS_INSERT_QUERY = """
+    INSERT INTO cluster_metrics (
+        time, cluster_name, cluster_id, status, health_status,
+        node_count, master_count, cpu_usage, memory_usage, gpu_usage,
+        disk_usage, network_io_mbps, running_pods, failed_pods, pending_pods,
+        workload_count, power_consumption_watts, cost_per_hour,
+        estimated_monthly_cost, health_score, efficiency_score, metadata
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15,
+        $16, $17, $18, $19, $20, $21, $22
+    )
+"""
+
+
+def _metrics_record(db_data: Dict[str, Any]) -> tuple:
+    """Row for cluster_metrics in METRICS_COLUMNS order"""
+    return tuple(_dumps(db_data[c]) if c == 'metadata' else db_data[c]
+                 for c in METRICS_COLUMNS)
+
 @dataclass
 class EnhancedClusterMetrics(ClusterMetrics):
 """
@@ -32,6 +75,11 @@ class EnhancedClusterMetrics(ClusterMetrics):
     data_source: str = "openstack_magnum"
     processing_time_ms: float = 0.0
     
+    @property
+    def eval_view(self) -> Mapping[str, Any]:
+        """Read-only live view of the fields, usable directly as rule-evaluation locals"""
+        return MappingProxyType(self.__dict__)
+    
     def to_db_dict(self) -> Dict[str, Any]:
         """
         db_data = asdict(self)
@@ -60,12 +108,20 @@ class EnhancedClusterMetrics(ClusterMetrics):
 class EnhancedMetricsCollector:
     """
     
+    # seconds a resolved cluster id is reused before it is looked up again
+    CLUSTER_ID_TTL = 300.0
+    
     def __init__(self, db_manager: DatabaseManager = None):
         self.base_collector = BaseMetricsCollector()
         self.db_manager = db_manager or get_database_manager()
         self.collection_session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # cluster_name -> (monotonic time, cluster id) for _ensure_cluster_exists
+        self._cluster_id_cache: Dict[str, tuple] = {}
+        # cluster_name -> (status, health_status) last written to cluster_current
+        self._last_status: Dict[str, tuple] = {}
         
-    async def collect_and_store_metrics(self, cluster_name: str) -> EnhancedClusterMetrics:
+    async def collect_and_store_metrics(self, cluster_name: str,
+                                        store_to_database: bool = True) -> EnhancedClusterMetrics:
         """
         start_time = datetime.now()
         try:
@@ -73,7 +129,8 @@ class EnhancedMetricsCollector:
             enhanced_metrics = self._enhance_metrics(base_metrics)
             enhanced_metrics.processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
             if self.db_manager.is_connected:
-                await self._store_to_database(enhanced_metrics)
+                if store_to_database:
+                    await self._store_to_database(enhanced_metrics)
                 await self._update_redis_cache(enhanced_metrics)
                 await self._publish_metrics_update(enhanced_metrics)
             else:
@@ -96,55 +153,75 @@ class EnhancedMetricsCollector:
             cluster_id = await self._ensure_cluster_exists(metrics.cluster_name, metrics.template_id)
             db_data['cluster_id'] = cluster_id
             
-
-            insert_query = """
-            INSERT INTO cluster_metrics (
-                time, cluster_name, cluster_id, status, health_status,
-                node_count, master_count, cpu_usage, memory_usage, gpu_usage,
-                disk_usage, network_io_mbps, running_pods, failed_pods, pending_pods,
-                workload_count, power_consumption_watts, cost_per_hour,
-                estimated_monthly_cost, health_score, efficiency_score, metadata
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15,
-                $16, $17, $18, $19, $20, $21, $22
-            )
-            """
-            await self.db_manager.execute_query(
-                insert_query,
-                db_data['time'], db_data['cluster_name'], db_data['cluster_id'],
-                db_data['status'], db_data['health_status'], db_data['node_count'],
-                db_data['master_count'], db_data['cpu_usage'], db_data['memory_usage'],
-                db_data['gpu_usage'], db_data['disk_usage'], db_data['network_io_mbps'],
-                db_data['running_pods'], db_data['failed_pods'], db_data['pending_pods'],
-                db_data['workload_count'], db_data['power_consumption_watts'],
-                db_data['cost_per_hour'], db_data['estimated_monthly_cost'],
-                db_data['health_score'], db_data['efficiency_score'],
-                json.dumps(db_data['metadata'])
-            )
+            await self.db_manager.execute(METRICS_INSERT_QUERY, *_metrics_record(db_data))
         except Exception as e:
             raise
+    
+    async def store_many_to_database(self, metrics_list: List[EnhancedClusterMetrics]):
+        """Write a batch of samples to cluster_metrics with one COPY
+
+        Samples whose cluster id could not be resolved are skipped. If the COPY
+        is rejected, the rows are inserted one by one so a bad row only loses itself.
+        """
+        if not metrics_list:
+            return
+        cluster_ids = await asyncio.gather(
+            *(self._ensure_cluster_exists(m.cluster_name, m.template_id) for m in metrics_list)
+        )
+        records = []
+        for metrics, cluster_id in zip(metrics_list, cluster_ids):
+            if cluster_id == "unknown":
+                logger.warning(f"Skipping metrics for {metrics.cluster_name}: cluster id not resolved")
+                continue
+            db_data = metrics.to_db_dict()
+            db_data['cluster_id'] = cluster_id
+            records.append(_metrics_record(db_data))
+        if not records:
+            return
+        
+        try:
+            await self.db_manager.copy_records('cluster_metrics', records, list(METRICS_COLUMNS))
+            return
+        except Exception as e:
+            logger.warning(f"COPY of {len(records)} metrics rows failed, inserting row by row: {e}")
+        
+        failed = 0
+        for record in records:
+            try:
+                await self.db_manager.execute(METRICS_INSERT_QUERY, *record)
+            except Exception as e:
+                failed += 1
+                last_error = e
+        if failed:
+            logger.error(f"{failed} of {len(records)} metrics rows could not be stored: {last_error}")
     async def _ensure_cluster_exists(self, cluster_name: str, template_id: str) -> str:
 """
-        """try:
-            cluster = await self.db_manager.execute_query(
+        """cached = self._cluster_id_cache.get(cluster_name)
+        if cached is not None and time.monotonic() - cached[0] < self.CLUSTER_ID_TTL:
+            return cached[1]
+        try:
+            cluster = await self.db_manager.fetch_one(
                 "SELECT id FROM clusters WHERE name = $1",
-                cluster_name, fetch='one'
+                cluster_name
             )
             
             if cluster:
-                return str(cluster['id'])
+                cluster_id = str(cluster['id'])
+                self._cluster_id_cache[cluster_name] = (time.monotonic(), cluster_id)
+                return cluster_id
             
-            cluster_id = await self.db_manager.execute_query(
+            cluster_id = await self.db_manager.fetch_val(
 """
                 INSERT INTO clusters (name, template_id, project_id, status)
                 VALUES ($1, $2, $3, $4)
                 RETURNING id
                 """,
-                cluster_name, template_id, "a6ce5f91a73544c09414fdcae43a129f", "UNKNOWN",
-                fetch='val'
+                cluster_name, template_id, "a6ce5f91a73544c09414fdcae43a129f", "UNKNOWN"
             )
             
-            return str(cluster_id)
+            cluster_id = str(cluster_id)
+            self._cluster_id_cache[cluster_name] = (time.monotonic(), cluster_id)
+            return cluster_id
             
         except Exception as e:
             return "unknown"
@@ -153,11 +230,6 @@ class EnhancedMetricsCollector:
 """
         try:
             metrics_data = RedisDataTypes.serialize_cluster_metrics(asdict(metrics))
-            await self.db_manager.redis_set(
-                RedisKeys.metrics_latest(metrics.cluster_name),
-                metrics_data,
-                RedisExpirePolicy.METRICS_LATEST
-            )
             current_status = {
                 'cluster_name': metrics.cluster_name,
                 'status': metrics.status,
@@ -165,15 +237,23 @@ class EnhancedMetricsCollector:
                 'cost_per_hour': metrics.cost_per_hour,
                 'last_update': datetime.now().isoformat()
             }
-            await self.db_manager.redis_set(
-                RedisKeys.cluster_current(metrics.cluster_name),
-                json.dumps(current_status),
-                RedisExpirePolicy.CLUSTER_CURRENT
-            )
             history_key = RedisKeys.metrics_history(metrics.cluster_name, "1h")
-            await self.db_manager.redis_client.lpush(history_key, metrics_data)
-            await self.db_manager.redis_client.expire(history_key, RedisExpirePolicy.METRICS_HISTORY)
-            await self.db_manager.redis_client.sadd(RedisKeys.cluster_list(), metrics.cluster_name)
+            async with self.db_manager.redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(RedisKeys.metrics_latest(metrics.cluster_name), metrics_data,
+                         ex=RedisExpirePolicy.METRICS_LATEST)
+                pipe.set(RedisKeys.cluster_current(metrics.cluster_name), _dumps(current_status),
+                         ex=RedisExpirePolicy.CLUSTER_CURRENT)
+                pipe.lpush(history_key, metrics_data)
+                pipe.expire(history_key, RedisExpirePolicy.METRICS_HISTORY)
+                pipe.sadd(RedisKeys.cluster_list(), metrics.cluster_name)
+                # Subscribers refresh just this cluster instead of waiting for a full sweep
+                status = (metrics.status, metrics.health_status)
+                previous = self._last_status.get(metrics.cluster_name)
+                if previous is not None and previous != status:
+                    pipe.publish(RedisPubSubChannels.CLUSTER_STATUS_CHANGED,
+                                 _dumps({'cluster_name': metrics.cluster_name}))
+                await pipe.execute()
+                self._last_status[metrics.cluster_name] = status
         except Exception as e:
     async def _publish_metrics_update(self, metrics: EnhancedClusterMetrics):
 """
@@ -186,13 +266,11 @@ class EnhancedMetricsCollector:
                 'event_type': 'metrics_updated'
             }
             
-            await self.db_manager.redis_publish(
-                RedisPubSubChannels.METRICS_UPDATED,
-                json.dumps(update_message)
-            )
+            message = _dumps(update_message)
+            await self.db_manager.redis_publish(RedisPubSubChannels.METRICS_UPDATED, message)
             
             cluster_channel = f"kcloud:events:cluster:{metrics.cluster_name}:metrics"
-            await self.db_manager.redis_publish(cluster_channel, json.dumps(update_message))
+            await self.db_manager.redis_publish(cluster_channel, message)
             
         except Exception as e:
     
@@ -213,16 +291,29 @@ class EnhancedMetricsCollector:
             processing_time_ms=0.0
         )
     
-    async def collect_multiple_clusters_async(self, cluster_names: List[str]) -> List[EnhancedClusterMetrics]:
-        """tasks = [self.collect_and_store_metrics(name) for name in cluster_names]
+    async def collect_multiple_clusters_async(self, cluster_names: List[str],
+                                              bulk_store: bool = True,
+                                              store_to_database: bool = True) -> List[EnhancedClusterMetrics]:
+        """tasks = [self.collect_and_store_metrics(name, store_to_database=store_to_database and not bulk_store)
+                 for name in cluster_names]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         metrics_list = []
+        collected = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 metrics_list.append(self._create_error_metrics(cluster_names[i], str(result)))
             else:
                 metrics_list.append(result)
+                if result.data_source != "error_handler":
+                    collected.append(result)
+        
+        # All successfully collected samples go to Postgres in a single COPY
+        if store_to_database and bulk_store and collected and self.db_manager.is_connected:
+            try:
+                await self.store_many_to_database(collected)
+            except Exception as e:
+                logger.error(f"Bulk metrics insert failed: {e}")
         
         return metrics_list
     
@@ -245,7 +336,7 @@ class EnhancedMetricsCollector:
                 return [RedisDataTypes.deserialize_cluster_metrics(data) for data in history_data]
             
             since_time = datetime.now() - timedelta(hours=hours)
-            history = await self.db_manager.execute_query(
+            history = await self.db_manager.fetch_all(
 """
                 SELECT * FROM cluster_metrics
                 WHERE cluster_name = $1 AND time >= $2
@@ -17,15 +17,39 @@ except ImportError:
         from .realtime_dashboard import RealTimeDashboard
     except ImportError:
         raise ImportError("monitoring modules not found. Please ensure they're in PYTHONPATH or install the package")
+
+
+def _connect_alert_redis():
+    """Synchronous Redis client for AlertSystem publishing, or None when Redis is unavailable"""
+    try:
+        import redis
+        try:
+            from infrastructure.database.connection import get_database_config
+        except ImportError:
+            from database.connection import get_database_config
+        config = get_database_config()
+        client = redis.Redis.from_url(
+            config.redis_url,
+            decode_responses=True,
+            socket_timeout=config.connection_timeout,
+            # Probed at startup; a missing server should not stall the monitor
+            socket_connect_timeout=min(config.connection_timeout, 2)
+        )
+        client.ping()
+        return client
+    except Exception:
+        return None
+
 class IntegratedMonitor:
 """
-    """def __init__(self, update_interval: int = 30):
+    """def __init__(self, update_interval: int = 30, redis_client=None):
         self.update_interval = update_interval
         self.running = False
         
 
         self.metrics_collector = MetricsCollector()
-        self.alert_system = AlertSystem()
+        # Alerts are pipelined to Redis when a server is reachable
+        self.alert_system = AlertSystem(redis_client or _connect_alert_redis())
         self.dashboard = RealTimeDashboard(update_interval)
         
 
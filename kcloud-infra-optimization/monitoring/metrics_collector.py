@@ -6,8 +6,9 @@ import time
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+import numpy as np
 try:
     from magnumclient import client as magnum_client
     from keystoneauth1 import loading, session
@@ -58,10 +59,57 @@ class ClusterMetrics:
     health_score: float = 0.0
     efficiency_score: float = 0.0
     
+    def __post_init__(self):
+        # status values come from a small fixed set and are compared against rule
+        # literals on every evaluation; interned copies make those matches a pointer check
+        if isinstance(self.status, str):
+            self.status = sys.intern(self.status)
+        if isinstance(self.health_status, str):
+            self.health_status = sys.intern(self.health_status)
+    
     def to_dict(self) -> Dict:
         """
         return asdict(self)
 
+class ClusterMetricsBuffer:
+    """Batch of ClusterMetrics stored column-wise (one array per field)
+
+    Feeds vectorized consumers such as AlertSystem.process_metrics_batch. Columns
+    are built lazily from the appended samples and rebuilt after further appends.
+    """
+    FLOAT_FIELDS = ('cost_per_hour', 'health_score', 'efficiency_score', 'cpu_usage',
+                    'memory_usage', 'gpu_usage', 'power_consumption_watts')
+    INT_FIELDS = ('failed_pods', 'pending_pods', 'node_count')
+    STR_FIELDS = ('cluster_name', 'status')
+    
+    def __init__(self, metrics: Iterable[ClusterMetrics] = ()):
+        self.metrics: List[ClusterMetrics] = list(metrics)
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+    
+    def __len__(self) -> int:
+        return len(self.metrics)
+    
+    def append(self, metrics: ClusterMetrics):
+        self.metrics.append(metrics)
+        self._columns = None
+    
+    def clear(self):
+        self.metrics.clear()
+        self._columns = None
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        if self._columns is None:
+            n = len(self.metrics)
+            columns = {}
+            for name in self.FLOAT_FIELDS:
+                columns[name] = np.fromiter((getattr(m, name) for m in self.metrics), dtype=np.float64, count=n)
+            for name in self.INT_FIELDS:
+                columns[name] = np.fromiter((getattr(m, name) for m in self.metrics), dtype=np.int64, count=n)
+            for name in self.STR_FIELDS:
+                columns[name] = np.array([getattr(m, name) for m in self.metrics], dtype=str)
+            self._columns = columns
+        return self._columns
+
 class MetricsCollector:
     """
     
@@ -14,6 +14,7 @@ from enum import Enum
 import openstack
 from openstack.connection import Connection
 from openstack.exceptions import SDKException, ResourceNotFound
+from requests.adapters import HTTPAdapter
 
 # Logging
 import logging
@@ -85,11 +86,12 @@ class ClusterInfo:
 class OpenStackClusterCRUD:
     """
     
-    def __init__(self, cloud_name: str = "openstack"):
+    def __init__(self, cloud_name: str = "openstack", pool_maxsize: int = 32):
         """Args:
 """
         try:
             self.conn = openstack.connect(cloud=cloud_name)
+            self._mount_pooled_adapter(pool_maxsize)
 
             if hasattr(self.conn, 'current_project_id'):
                 self.project_id = self.conn.current_project_id
@@ -106,6 +108,24 @@ class OpenStackClusterCRUD:
             logger.error(f"Failed to connect to OpenStack: {e}")
             raise
             
+    def _mount_pooled_adapter(self, pool_maxsize: int):
+        """Keep up to pool_maxsize keep-alive connections per endpoint
+
+        All calls share the keystoneauth session of self.conn, so concurrent
+        callers reuse TLS connections instead of re-handshaking per request.
+        """
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        http_session = self.conn.session.session
+        http_session.mount("https://", adapter)
+        http_session.mount("http://", adapter)
+
+    def close(self):
+        """Release pooled OpenStack connections"""
+        try:
+            self.conn.close()
+        except Exception as e:
+            logger.warning(f"Failed to close OpenStack connection: {e}")
+
     def _wait_for_cluster_status(
         self,
         cluster_id: str,